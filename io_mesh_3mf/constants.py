@@ -16,6 +16,8 @@ This module defines some constants for 3MF's file structure.
 These are the constants that are inherent to the 3MF file format.
 """
 
+import mathutils as _mathutils  # For the identity transformation. Private, so that star imports don't pick it up.
+
 SUPPORTED_EXTENSIONS = set()  # Set of namespaces for 3MF extensions that we support.
 # File contents to use when files must be preserved but there's a file with different content in a previous archive.
 # Only for flagging. This will not be in the final 3MF archives.
@@ -40,6 +42,9 @@ MODEL_NAMESPACES = {
     "3mf": MODEL_NAMESPACE
 }
 MODEL_DEFAULT_UNIT = "millimeter"  # If the unit is missing, it will be this.
+# If a transformation is missing, it is the identity. Importing and exporting share this one matrix instead of
+# allocating a new one each time. It is frozen, since modifying it would change all of those transformations at once.
+IDENTITY = _mathutils.Matrix.Identity(4).freeze()
 
 # Constants in the ContentTypes file.
 CONTENT_TYPES_NAMESPACE = "http://schemas.openxmlformats.org/package/2006/content-types"
@@ -274,7 +274,7 @@ class Export3MF(bpy.types.Operator, bpy_extras.io_utils.ExportHelper):
             self.num_written += 1
             item_element.attrib[f"{{{MODEL_NAMESPACE}}}objectid"] = str(objectid)
             mesh_transformation = transformation @ mesh_transformation
-            if mesh_transformation != mathutils.Matrix.Identity(4):
+            if mesh_transformation != IDENTITY:
                 item_element.attrib[f"{{{MODEL_NAMESPACE}}}transform"] =\
                     self.format_transformation(mesh_transformation)
 
@@ -337,7 +337,7 @@ class Export3MF(bpy.types.Operator, bpy_extras.io_utils.ExportHelper):
                     f"{{{MODEL_NAMESPACE}}}component")
                 self.num_written += 1
                 component_element.attrib[f"{{{MODEL_NAMESPACE}}}objectid"] = str(child_id)
-                if child_transformation != mathutils.Matrix.Identity(4):
+                if child_transformation != IDENTITY:
                     component_element.attrib[f"{{{MODEL_NAMESPACE}}}transform"] =\
                         self.format_transformation(child_transformation)
 
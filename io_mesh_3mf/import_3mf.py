@@ -28,7 +28,7 @@ import zipfile  # To read the 3MF files which are secretly zip archives.
 from .annotations import Annotations, ContentType, Relationship  # To use annotations to decide on what to import.
 from .constants import *
 from .metadata import MetadataEntry, Metadata  # To store and serialize metadata.
-from .unit_conversions import blender_to_metre, threemf_to_metre  # To convert to Blender's units.
+from .unit_conversions import threemf_to_blender  # To convert to Blender's units.
 
 log = logging.getLogger(__name__)
 
@@ -73,6 +73,15 @@ class Import3MF(bpy.types.Operator, bpy_extras.io_utils.ImportHelper):
         # Which of our resource materials already exists in the Blender scene as a Blender material.
         self.resource_to_material = {}
 
+        # Dictionary mapping resource IDs to the Blender meshes that were created for them, so that objects which are
+        # used multiple times share the same mesh data.
+        self.mesh_cache = {}
+
+        # Dictionary mapping the number of vertices and triangles to the resource objects of that size and the Blender
+        # meshes that were created for them, so that different resource objects with the same mesh data share the same
+        # mesh too.
+        self.mesh_pool = {}
+
         self.num_loaded = 0
 
     def execute(self, context):
@@ -87,6 +96,8 @@ class Import3MF(bpy.types.Operator, bpy_extras.io_utils.ImportHelper):
         self.resource_objects = {}
         self.resource_materials = {}
         self.resource_to_material = {}
+        self.mesh_cache = {}
+        self.mesh_pool = {}
         self.num_loaded = 0
         scene_metadata = Metadata()
         # If there was already metadata in the scene, combine that with this file.
@@ -136,6 +147,8 @@ class Import3MF(bpy.types.Operator, bpy_extras.io_utils.ImportHelper):
                 scale_unit = self.unit_scale(context, root)
                 self.resource_objects = {}
                 self.resource_materials = {}
+                self.mesh_cache = {}
+                self.mesh_pool = {}
                 scene_metadata = self.read_metadata(root, scene_metadata)
                 self.read_materials(root)
                 self.read_objects(root)
@@ -352,8 +365,7 @@ class Import3MF(bpy.types.Operator, bpy_extras.io_utils.ImportHelper):
 
         threemf_unit = root.attrib.get("unit", MODEL_DEFAULT_UNIT)
         blender_unit = context.scene.unit_settings.length_unit
-        scale *= threemf_to_metre[threemf_unit]  # Convert 3MF units to metre.
-        scale /= blender_to_metre[blender_unit]  # Convert metre to Blender's units.
+        scale *= threemf_to_blender[threemf_unit][blender_unit]  # Convert 3MF units to Blender's units.
 
         return scale
 
@@ -585,9 +597,8 @@ class Import3MF(bpy.types.Operator, bpy_extras.io_utils.ImportHelper):
         """
         result = []
         for component_node in object_node.iterfind("./3mf:components/3mf:component", MODEL_NAMESPACES):
-            try:
-                objectid = component_node.attrib["objectid"]
-            except KeyError:  # ID is required.
+            objectid = component_node.attrib.get("objectid")
+            if objectid is None:  # ID is required.
                 continue  # Ignore this invalid component.
             transform = self.parse_transformation(component_node.attrib.get("transform", ""))
 
@@ -611,29 +622,24 @@ class Import3MF(bpy.types.Operator, bpy_extras.io_utils.ImportHelper):
         -                 -
         ```
         :param transformation_str: A transformation as represented in 3MF.
-        :return: A `Matrix` object with the correct transformation.
+        :return: A `Matrix` object with the correct transformation. If the transformation is missing, this is the shared
+        (frozen) `IDENTITY` matrix.
         """
-        components = transformation_str.split(" ")
-        result = mathutils.Matrix.Identity(4)
         if transformation_str == "":  # Early-out if transformation is missing. This is not malformed.
-            return result
-        row = -1
-        col = 0
-        for component in components:
-            row += 1
-            if row > 2:
-                col += 1
-                row = 0
-                if col > 3:
-                    log.warning(f"Transformation matrix contains too many components: {transformation_str}")
-                    break  # Too many components. Ignore the rest.
+            return IDENTITY
+        components = transformation_str.split(" ")
+        # The 3MF lists the matrix column by column, without the bottom row. Start from the identity in that order.
+        values = [1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0]
+        for index, component in enumerate(components):
+            if index >= len(values):
+                log.warning(f"Transformation matrix contains too many components: {transformation_str}")
+                break  # Too many components. Ignore the rest.
             try:
-                component_float = float(component)
+                values[index] = float(component)
             except ValueError:  # Not a proper float. Skip this one.
                 log.warning(f"Transformation matrix malformed: {transformation_str}")
-                continue
-            result[row][col] = component_float
-        return result
+        # Construct the matrix from its rows in one go, rather than assigning each element separately.
+        return mathutils.Matrix((values[0::3], values[1::3], values[2::3], (0.0, 0.0, 0.0, 1.0)))
 
     def build_items(self, root, scale_unit):
         """
@@ -663,12 +669,18 @@ class Import3MF(bpy.types.Operator, bpy_extras.io_utils.ImportHelper):
                     datatype="xs:string",
                     value=build_item.attrib["partnumber"])
 
-            transform = mathutils.Matrix.Scale(scale_unit, 4)
-            transform @= self.parse_transformation(build_item.attrib.get("transform", ""))
+            # Skip the multiplication if either of the two factors is the identity, which is the most common case.
+            transform = self.parse_transformation(build_item.attrib.get("transform", ""))
+            if scale_unit != 1.0:
+                if transform is IDENTITY:
+                    transform = mathutils.Matrix.Scale(scale_unit, 4)
+                else:
+                    transform = mathutils.Matrix.Scale(scale_unit, 4) @ transform
 
             self.build_object(resource_object, transform, metadata, [objectid])
 
-    def build_object(self, resource_object, transformation, metadata, objectid_stack_trace, parent=None):
+    def build_object(self, resource_object, transformation, metadata, objectid_stack_trace, parent=None,
+                     objectids_in_stack=None):
         """
         Converts a resource object into a Blender object.
 
@@ -681,45 +693,32 @@ class Import3MF(bpy.types.Operator, bpy_extras.io_utils.ImportHelper):
         :param objectid_stack_trace: A list of all object IDs that have been processed so far, including the object ID
         we're processing now.
         :param parent: The resulting object must be marked as a child of this Blender object.
+        :param objectids_in_stack: The same object IDs as in the stack trace, as a set for faster lookups. It is kept
+        up to date along with the stack trace during the recursion. If not provided, it is created from the stack trace.
         :return: A sequence of Blender objects. These objects may be "nested" in the sense that they sometimes refer to
         other objects as their parents.
         """
         # Create a mesh if there is mesh data here.
-        mesh = None
-        if resource_object.triangles:
-            mesh = bpy.data.meshes.new("3MF Mesh")
-            mesh.from_pydata(resource_object.vertices, [], resource_object.triangles)
-            mesh.update()
-            resource_object.metadata.store(mesh)
-
-            # Mapping resource materials to indices in the list of materials for this specific mesh.
-            materials_to_index = {}
-            for triangle_index, triangle_material in enumerate(resource_object.materials):
-                if triangle_material is None:
-                    continue
-
-                # Add the material to Blender if it doesn't exist yet. Otherwise create a new material in Blender.
-                if triangle_material not in self.resource_to_material:
-                    material = bpy.data.materials.new(triangle_material.name)
-                    material.use_nodes = True
-                    principled = bpy_extras.node_shader_utils.PrincipledBSDFWrapper(material, is_readonly=False)
-                    principled.base_color = triangle_material.color[:3]
-                    principled.alpha = triangle_material.color[3]
-                    self.resource_to_material[triangle_material] = material
-                else:
-                    material = self.resource_to_material[triangle_material]
-
-                # Add the material to this mesh if it doesn't have it yet. Otherwise re-use previous index.
-                if triangle_material not in materials_to_index:
-                    new_index = len(mesh.materials.items())
-                    if new_index > 32767:
-                        log.warning("Blender doesn't support more than 32768 different materials per mesh.")
-                        continue
-                    mesh.materials.append(material)
-                    materials_to_index[triangle_material] = new_index
-
-                # Assign the material to the correct triangle.
-                mesh.polygons[triangle_index].material_index = materials_to_index[triangle_material]
+        # If this resource object was built before, re-use its mesh so that all instances share the same mesh data.
+        objectid = objectid_stack_trace[-1]
+        mesh = self.mesh_cache.get(objectid)
+        if mesh is None and resource_object.triangles:
+            # Different resource objects may also contain exactly the same mesh. Share the mesh data then too.
+            # Only compare the contents with meshes of the same size, so that a unique mesh costs just one lookup.
+            # The materials and metadata are stored in the mesh as well, so those must be equal too.
+            size = (len(resource_object.vertices), len(resource_object.triangles))
+            candidates = self.mesh_pool.setdefault(size, [])
+            for candidate, candidate_mesh in candidates:
+                if candidate.vertices == resource_object.vertices\
+                        and candidate.triangles == resource_object.triangles\
+                        and candidate.materials == resource_object.materials\
+                        and list(candidate.metadata.values()) == list(resource_object.metadata.values()):
+                    mesh = candidate_mesh
+                    break
+            else:  # No mesh with the same contents yet.
+                mesh = self.build_mesh(resource_object)
+                candidates.append((resource_object, mesh))
+            self.mesh_cache[objectid] = mesh
 
         # Create an object.
         blender_object = bpy.data.objects.new("3MF Object", mesh)
@@ -728,7 +727,8 @@ class Import3MF(bpy.types.Operator, bpy_extras.io_utils.ImportHelper):
             blender_object.parent = parent
         blender_object.matrix_world = transformation
         bpy.context.collection.objects.link(blender_object)
-        bpy.context.view_layer.objects.active = blender_object
+        if parent is None:  # Only make the top-level object active. Making every component active is wasted effort.
+            bpy.context.view_layer.objects.active = blender_object
         blender_object.select_set(True)
         metadata.store(blender_object)
         if "3mf:object_type" in resource_object.metadata\
@@ -737,8 +737,10 @@ class Import3MF(bpy.types.Operator, bpy_extras.io_utils.ImportHelper):
             blender_object.hide_render = True
 
         # Recurse for all components.
+        if objectids_in_stack is None and resource_object.components:  # Only the top of the recursion creates it.
+            objectids_in_stack = set(objectid_stack_trace)
         for component in resource_object.components:
-            if component.resource_object in objectid_stack_trace:
+            if component.resource_object in objectids_in_stack:
                 # These object IDs refer to each other in a loop. Don't go in there!
                 log.warning(f"Recursive components in object ID: {component.resource_object}")
                 continue
@@ -747,7 +749,71 @@ class Import3MF(bpy.types.Operator, bpy_extras.io_utils.ImportHelper):
             except KeyError:  # Invalid resource ID. Doesn't exist!
                 log.warning(f"Build item with unknown resource ID: {component.resource_object}")
                 continue
-            transform = transformation @ component.transformation  # Apply the child's transformation and pass it on.
+            # Apply the child's transformation and pass it on. Most components are not transformed, so skip the
+            # multiplication then.
+            if component.transformation is IDENTITY:
+                transform = transformation
+            elif transformation is IDENTITY:
+                transform = component.transformation
+            else:
+                transform = transformation @ component.transformation
             objectid_stack_trace.append(component.resource_object)
-            self.build_object(child_object, transform, metadata, objectid_stack_trace, parent=blender_object)
+            objectids_in_stack.add(component.resource_object)
+            self.build_object(
+                child_object,
+                transform,
+                metadata,
+                objectid_stack_trace,
+                parent=blender_object,
+                objectids_in_stack=objectids_in_stack)
             objectid_stack_trace.pop()
+            objectids_in_stack.remove(component.resource_object)  # Can't be in there twice, since loops are refused.
+
+    def build_mesh(self, resource_object):
+        """
+        Creates a Blender mesh from the mesh data of a resource object.
+
+        The materials of the triangles are created in Blender as well if they didn't exist yet.
+        :param resource_object: The resource object containing the mesh data.
+        :return: A Blender mesh.
+        """
+        mesh = bpy.data.meshes.new("3MF Mesh")
+        mesh.from_pydata(resource_object.vertices, [], resource_object.triangles)
+        mesh.update()
+        resource_object.metadata.store(mesh)
+
+        # Mapping resource materials to indices in the list of materials for this specific mesh.
+        materials_to_index = {}
+        # The material index of each triangle, to assign to the polygons in one batch rather than one by one.
+        material_indices = [0] * len(resource_object.materials)
+        for triangle_index, triangle_material in enumerate(resource_object.materials):
+            if triangle_material is None:
+                continue
+
+            # Add the material to Blender if it doesn't exist yet. Otherwise create a new material in Blender.
+            if triangle_material not in self.resource_to_material:
+                material = bpy.data.materials.new(triangle_material.name)
+                material.use_nodes = True
+                principled = bpy_extras.node_shader_utils.PrincipledBSDFWrapper(material, is_readonly=False)
+                principled.base_color = triangle_material.color[:3]
+                principled.alpha = triangle_material.color[3]
+                self.resource_to_material[triangle_material] = material
+            else:
+                material = self.resource_to_material[triangle_material]
+
+            # Add the material to this mesh if it doesn't have it yet. Otherwise re-use previous index.
+            if triangle_material not in materials_to_index:
+                new_index = len(mesh.materials.items())
+                if new_index > 32767:
+                    log.warning("Blender doesn't support more than 32768 different materials per mesh.")
+                    continue
+                mesh.materials.append(material)
+                materials_to_index[triangle_material] = new_index
+
+            # Assign the material to the correct triangle.
+            material_indices[triangle_index] = materials_to_index[triangle_material]
+
+        if materials_to_index:  # Only if any triangle got a material. Otherwise they all keep the default of 0.
+            mesh.polygons.foreach_set("material_index", material_indices)
+
+        return mesh
@@ -48,17 +48,18 @@ class Metadata:
         :param key: The name of the entry.
         :param value: A `MetadataEntry` object to store.
         """
-        if key not in self.metadata:
+        try:
+            competing = self.metadata[key]
+        except KeyError:
             # Completely new value. We can just store this one, since it's always consistent with existing metadata.
             self.metadata[key] = value
             return
 
-        if self.metadata[key] is None:
+        if competing is None:
             # This entry was already in conflict with another entry and erased.
             # The new value will also be in conflict with at least one, so should also not be stored.
             return
 
-        competing = self.metadata[key]
         if value.value != competing.value or value.datatype != competing.datatype:
             # These two are inconsistent. Erase both!
             self.metadata[key] = None
@@ -80,10 +81,11 @@ class Metadata:
         :return: The `MetadataEntry` object stored there.
         :raises: `KeyError` if there is no metadata entry or it was in conflict.
         """
-        if key not in self.metadata or self.metadata[key] is None:
+        entry = self.metadata.get(key)
+        if entry is None:
             # Metadata entry doesn't exist, or its values are conflicting with each other across multiple files.
             raise KeyError(key)
-        return self.metadata[key]
+        return entry
 
     def __contains__(self, item):
         """
@@ -92,7 +94,7 @@ class Metadata:
         :return: `True` if the metadata entry is present and not in conflict, or `False` if it's not present or in
         conflict with metadata values from multiple files.
         """
-        return item in self.metadata and self.metadata[item] is not None
+        return self.metadata.get(item) is not None
 
     def __bool__(self):
         """
@@ -41,3 +41,11 @@ threemf_to_metre = {  # Scale of each of 3MF's length units to a metre.
     'foot': 0.3048,
     'meter': 1
 }
+
+# Precomputed scale of each of 3MF's length units (outer dict) to each of Blender's length units (inner dicts), i.e.
+# how many Blender units go in one 3MF unit.
+threemf_to_blender = {
+    threemf_unit: {
+        blender_unit: threemf_scale / blender_scale for blender_unit, blender_scale in blender_to_metre.items()
+    } for threemf_unit, threemf_scale in threemf_to_metre.items()
+}
@@ -16,6 +16,7 @@ that they get run then.
 """
 
 import sys  # To mock entire packages.
+import types  # To create plain modules for the packages that only need to provide a few classes.
 import unittest.mock  # To mock away the Blender API.
 
 # Mock all of the Blender API packages.
@@ -24,12 +25,28 @@ sys.modules["bpy.ops"] = unittest.mock.MagicMock()
 sys.modules["bpy.props"] = unittest.mock.MagicMock()
 sys.modules["bpy.types"] = unittest.mock.MagicMock()
 sys.modules["bpy.utils"] = unittest.mock.MagicMock()
-sys.modules["bpy_extras"] = unittest.mock.MagicMock()
-sys.modules["bpy_extras.io_utils"] = unittest.mock.MagicMock()
-sys.modules["bpy_extras.node_shader_utils"] = unittest.mock.MagicMock()
 sys.modules["idprop"] = unittest.mock.MagicMock()
 sys.modules["idprop.types"] = unittest.mock.MagicMock()
 
+# Of bpy_extras, only the classes filled in below are used. Nothing is called on them that a test needs to inspect, so
+# plain modules suffice there. The submodules need to be linked to their parent by hand, as an import would do.
+sys.modules["bpy_extras"] = types.ModuleType("bpy_extras")
+sys.modules["bpy_extras.io_utils"] = types.ModuleType("bpy_extras.io_utils")
+sys.modules["bpy_extras.node_shader_utils"] = types.ModuleType("bpy_extras.node_shader_utils")
+sys.modules["bpy_extras"].io_utils = sys.modules["bpy_extras.io_utils"]
+sys.modules["bpy_extras"].node_shader_utils = sys.modules["bpy_extras.node_shader_utils"]
+
+# The import and export classes inherit from classes from the Blender API. These classes would be MagicMocks as well.
+# However their metaclasses are then also MagicMocks, but different instances of MagicMock.
+# Python sees this as that the metaclasses that ImportHelper/ExportHelper inherits from are not the same and raises an
+# error. So here we need to specify that the classes that they inherit from are NOT MagicMock but just an ordinary mock
+# object. This is done once for all test modules, before any of them import the units under test.
+from .mock.bpy import MockOperator, MockExportHelper, MockImportHelper, MockPrincipledBSDFWrapper
+sys.modules["bpy"].types.Operator = MockOperator  # The add-on reaches bpy.types through the mocked bpy module.
+sys.modules["bpy_extras.io_utils"].ImportHelper = MockImportHelper
+sys.modules["bpy_extras.io_utils"].ExportHelper = MockExportHelper
+sys.modules["bpy_extras.node_shader_utils"].PrincipledBSDFWrapper = MockPrincipledBSDFWrapper
+
 from .import_3mf import TestImport3MF
 from .export_3mf import TestExport3MF
 from .metadata import TestMetadata
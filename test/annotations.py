@@ -15,19 +15,8 @@ import json  # To get the ground truth of stored data from the annotations.
 import unittest.mock  # To mock away the Blender API.
 import xml.etree.ElementTree  # To create relationships documents.
 
-from .mock.bpy import MockOperator, MockExportHelper, MockImportHelper
-
-# The import and export classes inherit from classes from the Blender API. These classes would be MagicMocks as well.
-# However their metaclasses are then also MagicMocks, but different instances of MagicMock.
-# Python sees this as that the metaclasses that ImportHelper/ExportHelper inherits from are not the same and raises an
-# error. So here we need to specify that the classes that they inherit from are NOT MagicMock but just an ordinary mock
-# object.
-import bpy.types
-import bpy_extras.io_utils
-bpy.types.Operator = MockOperator
-bpy_extras.io_utils.ImportHelper = MockImportHelper
-bpy_extras.io_utils.ExportHelper = MockExportHelper
-import io_mesh_3mf.annotations  # Now finally we can import the unit under test.
+import bpy  # To inspect the calls that the annotations make to the Blender API.
+import io_mesh_3mf.annotations  # The unit under test. The test package has mocked the Blender API before this.
 from io_mesh_3mf.constants import *
 
 
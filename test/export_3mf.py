@@ -17,20 +17,9 @@ import unittest  # To run the tests.
 import unittest.mock  # To mock away the Blender API.
 import xml.etree.ElementTree  # To construct empty documents for the functions to build elements in.
 
-from .mock.bpy import MockOperator, MockExportHelper, MockImportHelper, MockPrincipledBSDFWrapper
-
-# The import and export classes inherit from classes from the Blender API. These classes would be MagicMocks as well.
-# However their metaclasses are then also MagicMocks, but different instances of MagicMock.
-# Python sees this as that the metaclasses that ImportHelper/ExportHelper inherits from are not the same and raises an
-# error. So here we need to specify that the classes that they inherit from are NOT MagicMock but just an ordinary mock
-# object.
-import bpy.types
-import bpy_extras.node_shader_utils
-bpy.types.Operator = MockOperator
-bpy_extras.io_utils.ImportHelper = MockImportHelper
-bpy_extras.io_utils.ExportHelper = MockExportHelper
-bpy_extras.node_shader_utils.PrincipledBSDFWrapper = MockPrincipledBSDFWrapper
-import io_mesh_3mf.export_3mf  # Now we may safely import the unit under test.
+from .mock.bpy import MockContext  # A plain Blender context, for the unit settings.
+
+import io_mesh_3mf.export_3mf  # The unit under test. The test package has mocked the Blender API before this.
 from io_mesh_3mf.constants import *
 from io_mesh_3mf.metadata import MetadataEntry
 
@@ -99,7 +88,7 @@ class TestExport3MF(unittest.TestCase):
         self.exporter.global_scale = global_scale
 
         # Stuff not considered for this test.
-        context = unittest.mock.MagicMock()
+        context = MockContext()
         context.scene.unit_settings.scale_length = 0
         context.scene.unit_settings.length_unit = 'MILLIMETERS'  # Same as the default 3MF unit.
 
@@ -114,7 +103,7 @@ class TestExport3MF(unittest.TestCase):
         """
         scene_scale = 0.9  # The scene scale is set to 90%.
 
-        context = unittest.mock.MagicMock()
+        context = MockContext()
         context.scene.unit_settings.scale_length = scene_scale
 
         # Stuff not considered for this test.
@@ -127,7 +116,7 @@ class TestExport3MF(unittest.TestCase):
         """
         Tests converting to 3MF default units.
         """
-        context = unittest.mock.MagicMock()
+        context = MockContext()
         context.scene.unit_settings.scale_length = 0  # Not considered for this test.
         self.exporter.global_scale = 1.0  # Not considered for this test.
 
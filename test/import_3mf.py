@@ -10,6 +10,7 @@
 
 # <pep8 compliant>
 
+import copy  # To give each test its own copy of the document skeletons.
 import io  # To simulate output streams to create input archives to test with.
 import mathutils  # To compare transformation matrices.
 import os.path  # To find the test resources.
@@ -19,23 +20,42 @@ import unittest.mock  # To mock away the Blender API.
 import xml.etree.ElementTree  # To construct 3MF documents as input for the importer functions.
 import zipfile  # To provide zip archives to some functions.
 
-from .mock.bpy import MockOperator, MockExportHelper, MockImportHelper
-
-# The import and export classes inherit from classes from the Blender API. These classes would be MagicMocks as well.
-# However their metaclasses are then also MagicMocks, but different instances of MagicMock.
-# Python sees this as that the metaclasses that ImportHelper/ExportHelper inherits from are not the same and raises an
-# error.
-# So here we need to specify that the classes that they inherit from are NOT MagicMock but just an ordinary mock object.
-import bpy.types
-import bpy_extras.io_utils
-bpy.types.Operator = MockOperator
-bpy_extras.io_utils.ImportHelper = MockImportHelper
-bpy_extras.io_utils.ExportHelper = MockExportHelper
-import io_mesh_3mf.import_3mf  # Now we may safely import the unit under test.
+from .mock.bpy import MockContext  # A plain Blender context, for the unit settings.
+
+import bpy  # To inspect the calls that the importer makes to the Blender API.
+import io_mesh_3mf.import_3mf  # The unit under test. The test package has mocked the Blender API before this.
 from io_mesh_3mf.constants import *
 # To compare the metadata objects created by the code under test.
 from io_mesh_3mf.metadata import Metadata, MetadataEntry
 
+# Fully qualified tag names of the 3MF elements that the tests construct documents with.
+TAG_MODEL = f"{{{MODEL_NAMESPACE}}}model"
+TAG_OBJECT = f"{{{MODEL_NAMESPACE}}}object"
+TAG_METADATA = f"{{{MODEL_NAMESPACE}}}metadata"
+TAG_RESOURCES = f"{{{MODEL_NAMESPACE}}}resources"
+TAG_BASEMATERIALS = f"{{{MODEL_NAMESPACE}}}basematerials"
+TAG_BASE = f"{{{MODEL_NAMESPACE}}}base"
+TAG_MESH = f"{{{MODEL_NAMESPACE}}}mesh"
+TAG_VERTICES = f"{{{MODEL_NAMESPACE}}}vertices"
+TAG_VERTEX = f"{{{MODEL_NAMESPACE}}}vertex"
+TAG_TRIANGLES = f"{{{MODEL_NAMESPACE}}}triangles"
+TAG_TRIANGLE = f"{{{MODEL_NAMESPACE}}}triangle"
+TAG_COMPONENTS = f"{{{MODEL_NAMESPACE}}}components"
+TAG_BUILD = f"{{{MODEL_NAMESPACE}}}build"
+TAG_ITEM = f"{{{MODEL_NAMESPACE}}}item"
+
+# Content type patterns to test assigning content types with. They are compiled once, since they never change.
+RE_TXT = re.compile(r".*\.txt")
+RE_MD = re.compile(r".*\.md")
+RE_SOME_DIRECTORY_TXT = re.compile(r"some_directory/file\.txt")
+RE_OTHER_DIRECTORY_TXT = re.compile(r"other_directory/file\.txt")
+RE_SOME_DIRECTORY_ANY = re.compile(r"some_directory/file.txt")  # Unescaped period, so also matches other characters.
+
+# An identity transformation, to compare with and to pass to the importer. Frozen, so that no test can modify it.
+# This is a different matrix than the shared IDENTITY of the importer, so passing it makes the importer go through its
+# regular path. Tests that need the shared matrix refer to it through the importer module.
+IDENTITY_MATRIX = mathutils.Matrix.Identity(4).freeze()
+
 
 class TestImport3MF(unittest.TestCase):
     """
@@ -51,27 +71,95 @@ class TestImport3MF(unittest.TestCase):
         super().__init__(*args, **kwargs)
         self.importer = None
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
-        Creates fixtures to help running these tests.
+        Creates fixtures that are not modified by any of the tests, so they can be shared by all tests.
         """
-        self.importer = io_mesh_3mf.import_3mf.Import3MF()  # An importer class.
-
-        self.single_triangle = io_mesh_3mf.import_3mf.ResourceObject(  # A model with just a single triangle.
+        cls.single_triangle = io_mesh_3mf.import_3mf.ResourceObject(  # A model with just a single triangle.
             vertices=[(0.0, 0.0, 0.0), (5.0, 0.0, 1.0), (0.0, 5.0, 1.0)],
             triangles=[(0, 1, 2)],
             materials=[None],
             components=[],
             metadata=Metadata()
         )
+
+        # The material that the importer creates for a <base> element without a name or color.
+        cls.fallback_material = io_mesh_3mf.import_3mf.ResourceMaterial(name="3MF Material", color=None)
+
+        # Read the archives in the test resources only once. The tests read them from memory.
+        cls.resources_path = os.path.join(os.path.dirname(__file__), "resources")
+        cls.archive_bytes = {}
+        for filename in ["corrupt_archive.3mf", "empty_archive.zip", "only_3dmodel_file.3mf"]:
+            with open(os.path.join(cls.resources_path, filename), "rb") as f:
+                cls.archive_bytes[filename] = f.read()
+
         # A dummy stream to write to, in order to construct archives to import from in-memory.
-        self.black_hole = io.BytesIO()
+        cls.black_hole = io.BytesIO()
+
+        # The archives written for the content types tests, by the contents of their content types file.
+        cls.content_types_archives = {}
+
+        # Skeletons of the documents that many of the tests fill in. Tests must only modify a copy of these.
+        cls.materials_skeleton = xml.etree.ElementTree.Element(TAG_MODEL)  # <model><resources><basematerials>.
+        resources = xml.etree.ElementTree.SubElement(cls.materials_skeleton, TAG_RESOURCES)
+        xml.etree.ElementTree.SubElement(resources, TAG_BASEMATERIALS, attrib={"id": "material-set"})
+        cls.mesh_skeleton = xml.etree.ElementTree.Element(TAG_OBJECT)  # <object><mesh><vertices> and <triangles>.
+        mesh = xml.etree.ElementTree.SubElement(cls.mesh_skeleton, TAG_MESH)
+        xml.etree.ElementTree.SubElement(mesh, TAG_VERTICES)
+        xml.etree.ElementTree.SubElement(mesh, TAG_TRIANGLES)
+
+    def setUp(self):
+        """
+        Creates fixtures to help running these tests.
+        """
+        self.importer = io_mesh_3mf.import_3mf.Import3MF()  # An importer class.
+
+        # Empty the dummy stream for the next test to write its archive to.
+        self.black_hole.seek(0)
+        self.black_hole.truncate()
+
+        # Give each test its own Blender context, data and operators. Restore the originals afterwards, so that no state
+        # leaks out.
+        for field in ("context", "data", "ops"):
+            patcher = unittest.mock.patch.object(bpy, field, unittest.mock.MagicMock())
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def new_materials_document(self):
+        """
+        Creates a fresh copy of the skeleton of a document with an empty <basematerials> element with ID "material-set".
+        :return: A tuple of the <model> element and the <basematerials> element in it.
+        """
+        root = copy.deepcopy(self.materials_skeleton)
+        return root, root[0][0]
+
+    def new_mesh_document(self):
+        """
+        Creates a fresh copy of the skeleton of an object with a mesh with empty <vertices> and <triangles> elements.
+        :return: A tuple of the <object> element, and the <vertices> and <triangles> elements in it.
+        """
+        object_node = copy.deepcopy(self.mesh_skeleton)
+        mesh_node = object_node[0]
+        return object_node, mesh_node[0], mesh_node[1]
 
-        self.resources_path = os.path.join(os.path.dirname(__file__), "resources")
+    def run_read_content_types(self, contents):
+        """
+        Runs `read_content_types` on an archive with the given content types file.
+        :param contents: The contents of the content types file in the archive, or `None` to leave the file out.
+        :return: The content types that were read, with the patterns of the regexes instead of the compiled regexes, so
+        that they can be compared.
+        """
+        if contents not in self.content_types_archives:  # Write each distinct archive only once.
+            stream = io.BytesIO()
+            with zipfile.ZipFile(stream, 'w') as archive:
+                if contents is not None:
+                    archive.writestr(CONTENT_TYPES_LOCATION, contents)
+            self.content_types_archives[contents] = stream.getvalue()
 
-        # Reset the Blender context before each test.
-        bpy.context = unittest.mock.MagicMock()
-        bpy.data = unittest.mock.MagicMock()
+        with zipfile.ZipFile(io.BytesIO(self.content_types_archives[contents])) as archive:
+            result = self.importer.read_content_types(archive)
+        return [(regex.pattern, mimetype) for regex, mimetype in result]
 
     def test_read_archive_non_existent(self):
         """
@@ -86,16 +174,16 @@ class TestImport3MF(unittest.TestCase):
         """
         Tests reading a corrupt archive file.
         """
-        archive_path = os.path.join(self.resources_path, "corrupt_archive.3mf")
-        self.assertEqual(self.importer.read_archive(archive_path), {}, "Corrupt files should return no files.")
+        archive = io.BytesIO(self.archive_bytes["corrupt_archive.3mf"])
+        self.assertEqual(self.importer.read_archive(archive), {}, "Corrupt files should return no files.")
 
     def test_read_archive_empty(self):
         """
         Tests reading an archive file that doesn't have the default model file.
         """
-        archive_path = os.path.join(self.resources_path, "empty_archive.zip")
+        archive = io.BytesIO(self.archive_bytes["empty_archive.zip"])
         self.assertEqual(
-            self.importer.read_archive(archive_path),
+            self.importer.read_archive(archive),
             {},
             "There are no files in this archive, so don't return any types.")
 
@@ -103,8 +191,8 @@ class TestImport3MF(unittest.TestCase):
         """
         Tests reading an archive where the 3D model is in the default position.
         """
-        archive_path = os.path.join(self.resources_path, "only_3dmodel_file.3mf")
-        result = self.importer.read_archive(archive_path)
+        archive = io.BytesIO(self.archive_bytes["only_3dmodel_file.3mf"])
+        result = self.importer.read_archive(archive)
         self.assertIn(
             MODEL_MIMETYPE,
             result,
@@ -115,19 +203,14 @@ class TestImport3MF(unittest.TestCase):
         document = xml.etree.ElementTree.ElementTree(file=model_files[0])
         self.assertEqual(
             document.getroot().tag,
-            f"{{{MODEL_NAMESPACE}}}model",
+            TAG_MODEL,
             "The file is an XML document with a <model> tag in the root.")
 
     def test_read_content_types_missing(self):
         """
         Tests reading an archive when the content types file is missing.
         """
-        archive = zipfile.ZipFile(self.black_hole, 'w')
-        result = self.importer.read_content_types(archive)  # At this point the archive is completely empty.
-
-        # In order to verify if the regexes are correct, transform the output to list the regex pattern rather than the
-        # compiled unit.
-        result = [(regex.pattern, mimetype) for regex, mimetype in result]
+        result = frozenset(self.run_read_content_types(None))  # The archive is completely empty.
         self.assertIn(
             (r".*\.rels", RELS_MIMETYPE),
             result,
@@ -141,16 +224,9 @@ class TestImport3MF(unittest.TestCase):
         """
         Tests reading an archive when the content types file is invalid XML.
         """
-        archive = zipfile.ZipFile(self.black_hole, 'w')
-        archive.writestr(
-            CONTENT_TYPES_LOCATION,
-            "I do one situp a day. Half of it when I get up out of bed, the other half when I lay down.")
+        result = frozenset(self.run_read_content_types(
+            "I do one situp a day. Half of it when I get up out of bed, the other half when I lay down."))
         # Not a valid XML document.
-        result = self.importer.read_content_types(archive)
-
-        # In order to verify if the regexes are correct, transform the output to list the regex pattern rather than the
-        # compiled unit.
-        result = [(regex.pattern, mimetype) for regex, mimetype in result]
         self.assertIn(
             (r".*\.rels", RELS_MIMETYPE),
             result,
@@ -164,13 +240,7 @@ class TestImport3MF(unittest.TestCase):
         """
         Tests reading an archive where the content types file doesn't define any content types.
         """
-        archive = zipfile.ZipFile(self.black_hole, 'w')
-        archive.writestr(CONTENT_TYPES_LOCATION, "")  # Completely empty file.
-        result = self.importer.read_content_types(archive)
-
-        # In order to verify if the regexes are correct, transform the output to list the regex pattern rather than the
-        # compiled unit.
-        result = [(regex.pattern, mimetype) for regex, mimetype in result]
+        result = frozenset(self.run_read_content_types(""))  # Completely empty file.
         self.assertIn(
             (r".*\.rels", RELS_MIMETYPE),
             result,
@@ -185,17 +255,11 @@ class TestImport3MF(unittest.TestCase):
         """
         Tests reading an archive that specifies all of the normal content types.
         """
-        archive = zipfile.ZipFile(self.black_hole, 'w')
-        archive.writestr(CONTENT_TYPES_LOCATION, """<?xml version="1.0" encoding="UTF-8"?>
+        result = frozenset(self.run_read_content_types("""<?xml version="1.0" encoding="UTF-8"?>
 <Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
     <Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml" />
     <Default Extension="model" ContentType="application/vnd.ms-package.3dmanufacturing-3dmodel+xml" />
-</Types>""")  # The default contents of the [Content_Types].xml document, for just the core specification.
-        result = self.importer.read_content_types(archive)
-
-        # In order to verify if the regexes are correct, transform the output to list the regex pattern rather than the
-        # compiled unit.
-        result = [(regex.pattern, mimetype) for regex, mimetype in result]
+</Types>"""))  # The default contents of the [Content_Types].xml document, for just the core specification.
         self.assertIn(
             (r".*\.rels", RELS_MIMETYPE),
             result,
@@ -211,17 +275,11 @@ class TestImport3MF(unittest.TestCase):
         """
         Tests reading an archive with customized content type defaults.
         """
-        archive = zipfile.ZipFile(self.black_hole, 'w')
-        archive.writestr(CONTENT_TYPES_LOCATION, """<?xml version="1.0" encoding="UTF-8"?>
+        result = self.run_read_content_types("""<?xml version="1.0" encoding="UTF-8"?>
 <Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
     <Default Extension="txt" ContentType="text/plain" />
     <Override PartName="/path/to/file.jpg" ContentType="image/thumbnail" />
 </Types>""")  # A customized content types specification, with one default and one override.
-        result = self.importer.read_content_types(archive)
-
-        # In order to verify if the regexes are correct, transform the output to list the regex pattern rather than the
-        # compiled unit.
-        result = [(regex.pattern, mimetype) for regex, mimetype in result]
         # If this throws a ValueError, the custom default was not parsed properly.
         custom_index = result.index((r".*\.txt", "text/plain"))
         rels_index = result.index((r".*\.rels", RELS_MIMETYPE))
@@ -241,17 +299,11 @@ class TestImport3MF(unittest.TestCase):
         """
         Tests reading an archive with customized content type overrides.
         """
-        archive = zipfile.ZipFile(self.black_hole, 'w')
-        archive.writestr(CONTENT_TYPES_LOCATION, """<?xml version="1.0" encoding="UTF-8"?>
+        result = self.run_read_content_types("""<?xml version="1.0" encoding="UTF-8"?>
 <Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
     <Default Extension="txt" ContentType="text/plain" />
     <Override PartName="/path/to/file.jpg" ContentType="image/thumbnail" />
 </Types>""")  # A customized content types specification, with one default and one override.
-        result = self.importer.read_content_types(archive)
-
-        # In order to verify if the regexes are correct, transform the output to list the regex pattern rather than the
-        # compiled unit.
-        result = [(regex.pattern, mimetype) for regex, mimetype in result]
         # If this throws a ValueError, the custom override was not parsed properly.
         override_index = result.index((r"/path/to/file\.jpg", "image/thumbnail"))
         default_index = result.index((r".*\.txt", "text/plain"))
@@ -265,9 +317,10 @@ class TestImport3MF(unittest.TestCase):
         """
         Tests assigning content types to an empty archive.
         """
-        archive = zipfile.ZipFile(self.black_hole, 'w')
-        content_types = [(re.compile(r".*\.txt"), "text/plain")]
-        result = self.importer.assign_content_types(archive, content_types)
+        zipfile.ZipFile(self.black_hole, 'w').close()  # Write an archive without any files.
+        content_types = [(RE_TXT, "text/plain")]
+        with zipfile.ZipFile(self.black_hole) as archive:
+            result = self.importer.assign_content_types(archive, content_types)
 
         self.assertEqual(result, {}, "There are no files in the archive to assign a content type.")
 
@@ -275,10 +328,11 @@ class TestImport3MF(unittest.TestCase):
         """
         Tests that the content types file is ignored in the archive. It should not show up in the result.
         """
-        archive = zipfile.ZipFile(self.black_hole, 'w')
-        archive.writestr(CONTENT_TYPES_LOCATION, "")  # Contents of the file don't matter for this test.
-        content_types = [(re.compile(r".*\.txt"), "text/plain")]
-        result = self.importer.assign_content_types(archive, content_types)
+        with zipfile.ZipFile(self.black_hole, 'w') as archive:
+            archive.writestr(CONTENT_TYPES_LOCATION, "")  # Contents of the file don't matter for this test.
+        content_types = [(RE_TXT, "text/plain")]
+        with zipfile.ZipFile(self.black_hole) as archive:
+            result = self.importer.assign_content_types(archive, content_types)
 
         self.assertEqual(
             result,
@@ -289,15 +343,16 @@ class TestImport3MF(unittest.TestCase):
         """
         Tests assigning content types if the content types specify a full path.
         """
-        archive = zipfile.ZipFile(self.black_hole, "w")
-        archive.writestr("some_directory/file.txt", "Those are 3 MF'ing nice models!")
-        archive.writestr("other_directory/file.txt", "Are you suggesting that coconuts migrate?")
+        with zipfile.ZipFile(self.black_hole, 'w') as archive:
+            archive.writestr("some_directory/file.txt", "Those are 3 MF'ing nice models!")
+            archive.writestr("other_directory/file.txt", "Are you suggesting that coconuts migrate?")
         content_types = [
-            (re.compile(r"some_directory/file\.txt"), "text/plain"),
-            (re.compile(r"other_directory/file\.txt"), "plain/wrong")
+            (RE_SOME_DIRECTORY_TXT, "text/plain"),
+            (RE_OTHER_DIRECTORY_TXT, "plain/wrong")
         ]
 
-        result = self.importer.assign_content_types(archive, content_types)
+        with zipfile.ZipFile(self.black_hole) as archive:
+            result = self.importer.assign_content_types(archive, content_types)
         expected_result = {
             "some_directory/file.txt": "text/plain",
             "other_directory/file.txt": "plain/wrong"
@@ -309,16 +364,17 @@ class TestImport3MF(unittest.TestCase):
         """
         Tests assigning content types if the content types specify an extension.
         """
-        archive = zipfile.ZipFile(self.black_hole, "w")
-        archive.writestr("some_directory/file.txt", "I fart in your general direction.")
-        archive.writestr("insult.txt", "Your mother was a hamster and your father smelt of elderberries.")
-        archive.writestr("what.md", "There's nothing wrong with you that an expensive operation can't prolong.")
+        with zipfile.ZipFile(self.black_hole, 'w') as archive:
+            archive.writestr("some_directory/file.txt", "I fart in your general direction.")
+            archive.writestr("insult.txt", "Your mother was a hamster and your father smelt of elderberries.")
+            archive.writestr("what.md", "There's nothing wrong with you that an expensive operation can't prolong.")
         content_types = [
-            (re.compile(r".*\.txt"), "text/plain"),
-            (re.compile(r".*\.md"), "text/markdown")
+            (RE_TXT, "text/plain"),
+            (RE_MD, "text/markdown")
         ]
 
-        result = self.importer.assign_content_types(archive, content_types)
+        with zipfile.ZipFile(self.black_hole) as archive:
+            result = self.importer.assign_content_types(archive, content_types)
         expected_result = {
             "some_directory/file.txt": "text/plain",
             "insult.txt": "text/plain",
@@ -331,13 +387,15 @@ class TestImport3MF(unittest.TestCase):
         """
         Tests whether the priority in the content types list is honoured.
         """
-        archive = zipfile.ZipFile(self.black_hole, "w")
-        archive.writestr(
-            "some_directory/file.txt",
-            "As the plane lands in Glasgow, passengers are reminded to set their watches back 25 years.")
+        with zipfile.ZipFile(self.black_hole, 'w') as archive:
+            archive.writestr(
+                "some_directory/file.txt",
+                "As the plane lands in Glasgow, passengers are reminded to set their watches back 25 years.")
+        archive = zipfile.ZipFile(self.black_hole)
+        self.addCleanup(archive.close)
         content_types = [
-            (re.compile(r".*\.txt"), "First type"),
-            (re.compile(r"some_directory/file.txt"), "Second type")
+            (RE_TXT, "First type"),
+            (RE_SOME_DIRECTORY_ANY, "Second type")
         ]
 
         result = self.importer.assign_content_types(archive, content_types)
@@ -368,11 +426,8 @@ class TestImport3MF(unittest.TestCase):
         ]
 
         with unittest.mock.patch("io_mesh_3mf.import_3mf.SUPPORTED_EXTENSIONS", {"http://a", "http://b"}):
-            for document_requirements in supported_documents:
-                with self.subTest(document_requirements=document_requirements):
-                    self.assertTrue(
-                        self.importer.is_supported(document_requirements),
-                        "These namespaces are supported (A and B are).")
+            rejected = [document for document in supported_documents if not self.importer.is_supported(document)]
+        self.assertListEqual(rejected, [], "These namespaces are supported (A and B are).")
 
     def test_is_supported_false(self):
         """
@@ -386,11 +441,8 @@ class TestImport3MF(unittest.TestCase):
         ]
 
         with unittest.mock.patch("io_mesh_3mf.import_3mf.SUPPORTED_EXTENSIONS", {"http://a", "http://b"}):
-            for document_requirements in not_supported_documents:
-                with self.subTest(document_requirements=document_requirements):
-                    self.assertFalse(
-                        self.importer.is_supported(document_requirements),
-                        "These namespaces are not supported (only A and B are).")
+            accepted = [document for document in not_supported_documents if self.importer.is_supported(document)]
+        self.assertListEqual(accepted, [], "These namespaces are not supported (only A and B are).")
 
     def test_unit_scale_global(self):
         """
@@ -401,9 +453,9 @@ class TestImport3MF(unittest.TestCase):
         self.importer.global_scale = global_scale
 
         # Stuff not considered for this test.
-        context = unittest.mock.MagicMock()
+        context = MockContext()
         context.scene.unit_settings.scale_length = 0
-        root = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}model")
+        root = xml.etree.ElementTree.Element(TAG_MODEL)
         root.attrib["unit"] = 'meter'
         context.scene.unit_settings.length_unit = 'METERS'
 
@@ -418,12 +470,12 @@ class TestImport3MF(unittest.TestCase):
         """
         scene_scale = 0.9  # The scene scale is set to 90%.
 
-        context = unittest.mock.MagicMock()
+        context = MockContext()
         context.scene.unit_settings.scale_length = scene_scale
 
         # Stuff not considered for this test.
         self.importer.global_scale = 1.0
-        root = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}model")
+        root = xml.etree.ElementTree.Element(TAG_MODEL)
         root.attrib["unit"] = 'meter'
         context.scene.unit_settings.length_unit = 'METERS'
 
@@ -437,10 +489,10 @@ class TestImport3MF(unittest.TestCase):
         Tests converting between different units of Blender and the 3MF.
         """
         # Setting up the test.
-        context = unittest.mock.MagicMock()
+        context = MockContext()
         context.scene.unit_settings.scale_length = 0  # Not considered for this test.
         self.importer.global_scale = 1.0  # Not considered for this test.
-        root = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}model")
+        root = xml.etree.ElementTree.Element(TAG_MODEL)
 
         # Table of correct conversions! This is the ground truth.
         # From 3MF unit (outer dict) to Blender unit (inner dicts), i.e. how many Blender units go in one 3MF unit.
@@ -568,19 +620,19 @@ class TestImport3MF(unittest.TestCase):
             }
         }
 
-        for blender_unit in correct_conversions:
-            for threemf_unit in correct_conversions[blender_unit]:
+        for blender_unit, conversions in correct_conversions.items():
+            context.scene.unit_settings.length_unit = blender_unit
+            for threemf_unit, expected in conversions.items():
                 with self.subTest(blender_unit=blender_unit, threemf_unit=threemf_unit):
-                    context.scene.unit_settings.length_unit = blender_unit
                     root.attrib["unit"] = threemf_unit
                     result = self.importer.unit_scale(context, root)
-                    self.assertAlmostEqual(result, correct_conversions[blender_unit][threemf_unit])
+                    self.assertAlmostEqual(result, expected)
 
     def test_read_metadata_entries_missing(self):
         """
         Tests reading metadata entries when there are no <metadata> elements.
         """
-        object_node = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}object")
+        object_node = xml.etree.ElementTree.Element(TAG_OBJECT)
 
         result = self.importer.read_metadata(object_node)
         self.assertEqual(len(result), 0, "There is no metadata in this document, so the metadata is empty.")
@@ -589,13 +641,10 @@ class TestImport3MF(unittest.TestCase):
         """
         Tests reading multiple metadata entries from the document.
         """
-        object_node = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}object")
-        metadata1_node = xml.etree.ElementTree.SubElement(object_node, f"{{{MODEL_NAMESPACE}}}metadata")
-        metadata1_node.attrib["name"] = "name1"
-        metadata1_node.text = "value1"
-        metadata2_node = xml.etree.ElementTree.SubElement(object_node, f"{{{MODEL_NAMESPACE}}}metadata")
-        metadata2_node.attrib["name"] = "name2"
-        metadata2_node.text = "value2"
+        object_node = xml.etree.ElementTree.fromstring(f"""<object xmlns="{MODEL_NAMESPACE}">
+    <metadata name="name1">value1</metadata>
+    <metadata name="name2">value2</metadata>
+</object>""")
 
         result = self.importer.read_metadata(object_node)
         self.assertEqual(len(result), 2, "We added 2 metadata entries.")
@@ -604,10 +653,8 @@ class TestImport3MF(unittest.TestCase):
         """
         Tests reading the name from a metadata entry.
         """
-        object_node = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}object")
-        metadata_node = xml.etree.ElementTree.SubElement(object_node, f"{{{MODEL_NAMESPACE}}}metadata")
-        metadata_node.attrib["name"] = "some name"
-        metadata_node.text = "value"
+        object_node = xml.etree.ElementTree.fromstring(
+            f"""<object xmlns="{MODEL_NAMESPACE}"><metadata name="some name">value</metadata></object>""")
 
         result = self.importer.read_metadata(object_node)
         self.assertIn("some name", result, "The metadata entry is stored by name.")
@@ -620,8 +667,8 @@ class TestImport3MF(unittest.TestCase):
 
         Those entries should get ignored.
         """
-        object_node = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}object")
-        metadata_node = xml.etree.ElementTree.SubElement(object_node, f"{{{MODEL_NAMESPACE}}}metadata")
+        object_node = xml.etree.ElementTree.Element(TAG_OBJECT)
+        metadata_node = xml.etree.ElementTree.SubElement(object_node, TAG_METADATA)
         metadata_node.text = "value"
 
         result = self.importer.read_metadata(object_node)
@@ -634,12 +681,11 @@ class TestImport3MF(unittest.TestCase):
         positive_preserve_values = ["1", "true", "tRuE", "bla", "anything really"]
         negative_preserve_values = ["0", "false", "fAlSe"]
 
-        object_node = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}object")
-        for preserve in positive_preserve_values + negative_preserve_values:
-            metadata_node = xml.etree.ElementTree.SubElement(object_node, f"{{{MODEL_NAMESPACE}}}metadata")
-            metadata_node.attrib["name"] = preserve
-            metadata_node.text = "value"
-            metadata_node.attrib["preserve"] = preserve
+        # Parse all entries in one go, rather than constructing each element separately.
+        entries = "".join(
+            f"<metadata name=\"{preserve}\" preserve=\"{preserve}\">value</metadata>"
+            for preserve in positive_preserve_values + negative_preserve_values)
+        object_node = xml.etree.ElementTree.fromstring(f"""<object xmlns="{MODEL_NAMESPACE}">{entries}</object>""")
 
         result = self.importer.read_metadata(object_node)  # Read them all at once.
 
@@ -660,10 +706,11 @@ class TestImport3MF(unittest.TestCase):
         """
         Tests reading the type from metadata entries.
         """
-        object_node = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}object")
-        metadata_node = xml.etree.ElementTree.SubElement(object_node, f"{{{MODEL_NAMESPACE}}}metadata")
-        metadata_node.attrib["type"] = "hyperset"
-        metadata_node.attrib["name"] = "some metadata"
+        object_node = xml.etree.ElementTree.Element(TAG_OBJECT)
+        xml.etree.ElementTree.SubElement(
+            object_node,
+            TAG_METADATA,
+            attrib={"type": "hyperset", "name": "some metadata"})
 
         result = self.importer.read_metadata(object_node)
         self.assertIn("some metadata", result, "We added this entry.")
@@ -673,10 +720,8 @@ class TestImport3MF(unittest.TestCase):
         """
         Tests combining an existing metadata set with new metadata from the document.
         """
-        object_node = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}object")
-        metadata_node = xml.etree.ElementTree.SubElement(object_node, f"{{{MODEL_NAMESPACE}}}metadata")
-        metadata_node.attrib["name"] = "cool"
-        metadata_node.text = "definitely"
+        object_node = xml.etree.ElementTree.fromstring(
+            f"""<object xmlns="{MODEL_NAMESPACE}"><metadata name="cool">definitely</metadata></object>""")
         # Using a dict here to mock the Metadata() object! Actual testing of the combining is done with the Metadata
         # class tests.
         existing_metadata = {"original_entry": "original_value"}
@@ -691,7 +736,7 @@ class TestImport3MF(unittest.TestCase):
         """
         Tests reading materials from a file that has no <basematerials> entry.
         """
-        root = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}model")
+        root = xml.etree.ElementTree.Element(TAG_MODEL)
 
         self.importer.read_materials(root)
 
@@ -704,12 +749,7 @@ class TestImport3MF(unittest.TestCase):
         """
         Tests reading materials from a file that has an empty <basematerials> tag.
         """
-        root = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}model")
-        resources = xml.etree.ElementTree.SubElement(root, f"{{{MODEL_NAMESPACE}}}resources")
-        xml.etree.ElementTree.SubElement(
-            resources,
-            f"{{{MODEL_NAMESPACE}}}basematerials",
-            attrib={"id": "material-set"})
+        root, _ = self.new_materials_document()
 
         self.importer.read_materials(root)
 
@@ -724,19 +764,14 @@ class TestImport3MF(unittest.TestCase):
 
         This material has no name or color. The importer uses defaults.
         """
-        root = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}model")
-        resources = xml.etree.ElementTree.SubElement(root, f"{{{MODEL_NAMESPACE}}}resources")
-        basematerials = xml.etree.ElementTree.SubElement(
-            resources,
-            f"{{{MODEL_NAMESPACE}}}basematerials",
-            attrib={"id": "material-set"})
-        xml.etree.ElementTree.SubElement(basematerials, f"{{{MODEL_NAMESPACE}}}base")
+        root, basematerials = self.new_materials_document()
+        xml.etree.ElementTree.SubElement(basematerials, TAG_BASE)
 
         self.importer.read_materials(root)
 
         ground_truth = {
             "material-set": {
-                0: io_mesh_3mf.import_3mf.ResourceMaterial(name="3MF Material", color=None)
+                0: self.fallback_material
             }
         }
         self.assertDictEqual(
@@ -748,14 +783,14 @@ class TestImport3MF(unittest.TestCase):
         """
         Test reading multiple materials from the same <basematerials> tag.
         """
-        root = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}model")
-        resources = xml.etree.ElementTree.SubElement(root, f"{{{MODEL_NAMESPACE}}}resources")
-        basematerials = xml.etree.ElementTree.SubElement(
-            resources,
-            f"{{{MODEL_NAMESPACE}}}basematerials",
-            attrib={"id": "material-set"})
-        xml.etree.ElementTree.SubElement(basematerials, f"{{{MODEL_NAMESPACE}}}base", attrib={"name": "PLA"})
-        xml.etree.ElementTree.SubElement(basematerials, f"{{{MODEL_NAMESPACE}}}base", attrib={"name": "BLA"})
+        root = xml.etree.ElementTree.fromstring(f"""<model xmlns="{MODEL_NAMESPACE}">
+    <resources>
+        <basematerials id="material-set">
+            <base name="PLA" />
+            <base name="BLA" />
+        </basematerials>
+    </resources>
+</model>""")
 
         self.importer.read_materials(root)
 
@@ -788,37 +823,29 @@ class TestImport3MF(unittest.TestCase):
             "3MF3MF": None  # Doesn't parse, since M is out of range for a hexadecimal number.
         }
 
-        for threemf_color, blender_color in color_translation.items():
+        # Put all colors in one document, one material for each, so that they can all be read at once.
+        root, basematerials = self.new_materials_document()
+        for threemf_color in color_translation:
+            base = xml.etree.ElementTree.SubElement(basematerials, TAG_BASE)
+            if threemf_color is not None:  # Leave out the attribute to test a missing color.
+                base.attrib["displaycolor"] = threemf_color
+
+        self.importer.read_materials(root)
+
+        materials = self.importer.resource_materials["material-set"]
+        for index, (threemf_color, blender_color) in enumerate(color_translation.items()):
             with self.subTest(threemf_color=threemf_color, blender_color=blender_color):
-                root = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}model")
-                resources = xml.etree.ElementTree.SubElement(root, f"{{{MODEL_NAMESPACE}}}resources")
-                basematerials = xml.etree.ElementTree.SubElement(
-                    resources,
-                    f"{{{MODEL_NAMESPACE}}}basematerials",
-                    attrib={"id": "material-set"})
-                xml.etree.ElementTree.SubElement(basematerials, f"{{{MODEL_NAMESPACE}}}base", attrib={
-                    "displaycolor": threemf_color
-                })
-
-                self.importer.resource_materials = {}
-                self.importer.read_materials(root)
-
-                ground_truth = {
-                    "material-set": {
-                        0: io_mesh_3mf.import_3mf.ResourceMaterial(name="3MF Material", color=blender_color)
-                    }
-                }
-                self.assertDictEqual(self.importer.resource_materials, ground_truth)
+                self.assertEqual(
+                    materials[index],
+                    io_mesh_3mf.import_3mf.ResourceMaterial(name="3MF Material", color=blender_color))
 
     def test_read_materials_missing_id(self):
         """
         Test reading materials from a <basematerials> tag that's missing an ID.
         """
-        root = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}model")
-        resources = xml.etree.ElementTree.SubElement(root, f"{{{MODEL_NAMESPACE}}}resources")
-        basematerials = xml.etree.ElementTree.SubElement(resources, f"{{{MODEL_NAMESPACE}}}basematerials")
-        # No ID in attrib!
-        xml.etree.ElementTree.SubElement(basematerials, f"{{{MODEL_NAMESPACE}}}base")
+        root, basematerials = self.new_materials_document()
+        del basematerials.attrib["id"]  # No ID in attrib!
+        xml.etree.ElementTree.SubElement(basematerials, TAG_BASE)
 
         self.importer.read_materials(root)
 
@@ -833,27 +860,25 @@ class TestImport3MF(unittest.TestCase):
 
         The lists of materials should then be combined.
         """
-        root = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}model")
-        resources = xml.etree.ElementTree.SubElement(root, f"{{{MODEL_NAMESPACE}}}resources")
-        base1 = xml.etree.ElementTree.SubElement(
-            resources,
-            f"{{{MODEL_NAMESPACE}}}basematerials",
-            attrib={"id": "set1"})
-        xml.etree.ElementTree.SubElement(base1, f"{{{MODEL_NAMESPACE}}}base")
-        base2 = xml.etree.ElementTree.SubElement(
-            resources,
-            f"{{{MODEL_NAMESPACE}}}basematerials",
-            attrib={"id": "set2"})
-        xml.etree.ElementTree.SubElement(base2, f"{{{MODEL_NAMESPACE}}}base")
+        root = xml.etree.ElementTree.fromstring(f"""<model xmlns="{MODEL_NAMESPACE}">
+    <resources>
+        <basematerials id="set1">
+            <base />
+        </basematerials>
+        <basematerials id="set2">
+            <base />
+        </basematerials>
+    </resources>
+</model>""")
 
         self.importer.read_materials(root)
 
         ground_truth = {
             "set1": {
-                0: io_mesh_3mf.import_3mf.ResourceMaterial(name="3MF Material", color=None)
+                0: self.fallback_material
             },
             "set2": {
-                0: io_mesh_3mf.import_3mf.ResourceMaterial(name="3MF Material", color=None)
+                0: self.fallback_material
             }
         }
         self.assertDictEqual(
@@ -867,23 +892,16 @@ class TestImport3MF(unittest.TestCase):
 
         One of them should get skipped then.
         """
-        root = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}model")
-        resources = xml.etree.ElementTree.SubElement(root, f"{{{MODEL_NAMESPACE}}}resources")
-        base1 = xml.etree.ElementTree.SubElement(
-            resources,
-            f"{{{MODEL_NAMESPACE}}}basematerials",
-            attrib={"id": "set1"})
-        xml.etree.ElementTree.SubElement(
-            base1,
-            f"{{{MODEL_NAMESPACE}}}base", attrib={"name": "First material"})
-        base2 = xml.etree.ElementTree.SubElement(
-            resources,
-            f"{{{MODEL_NAMESPACE}}}basematerials",
-            attrib={"id": "set1"})  # The same ID as the other one!
-        xml.etree.ElementTree.SubElement(
-            base2,
-            f"{{{MODEL_NAMESPACE}}}base",
-            attrib={"name": "Second material"})
+        root = xml.etree.ElementTree.fromstring(f"""<model xmlns="{MODEL_NAMESPACE}">
+    <resources>
+        <basematerials id="set1">
+            <base name="First material" />
+        </basematerials>
+        <basematerials id="set1"> <!-- The same ID as the other one! -->
+            <base name="Second material" />
+        </basematerials>
+    </resources>
+</model>""")
 
         self.importer.read_materials(root)
 
@@ -909,8 +927,8 @@ class TestImport3MF(unittest.TestCase):
         """
         Tests reading an object where the <vertices> element is missing.
         """
-        object_node = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}object")
-        xml.etree.ElementTree.SubElement(object_node, f"{{{MODEL_NAMESPACE}}}mesh")
+        object_node = xml.etree.ElementTree.Element(TAG_OBJECT)
+        xml.etree.ElementTree.SubElement(object_node, TAG_MESH)
 
         self.assertListEqual(
             self.importer.read_vertices(object_node),
@@ -921,9 +939,9 @@ class TestImport3MF(unittest.TestCase):
         """
         Tests reading an object where the <vertices> element is present, but empty.
         """
-        object_node = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}object")
-        mesh_node = xml.etree.ElementTree.SubElement(object_node, f"{{{MODEL_NAMESPACE}}}mesh")
-        xml.etree.ElementTree.SubElement(mesh_node, f"{{{MODEL_NAMESPACE}}}vertices")
+        object_node = xml.etree.ElementTree.Element(TAG_OBJECT)
+        mesh_node = xml.etree.ElementTree.SubElement(object_node, TAG_MESH)
+        xml.etree.ElementTree.SubElement(mesh_node, TAG_VERTICES)
 
         self.assertListEqual(
             self.importer.read_vertices(object_node),
@@ -938,15 +956,10 @@ class TestImport3MF(unittest.TestCase):
         """
         vertices = [(1.0, 2.0, 3.0), (4.0, 5.0, 6.0), (7.0, 8.0, 9.0)]  # A few vertices to test with.
 
-        # Set up the XML data to parse.
-        object_node = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}object")
-        mesh_node = xml.etree.ElementTree.SubElement(object_node, f"{{{MODEL_NAMESPACE}}}mesh")
-        vertices_node = xml.etree.ElementTree.SubElement(mesh_node, f"{{{MODEL_NAMESPACE}}}vertices")
-        for vertex in vertices:
-            vertex_node = xml.etree.ElementTree.SubElement(vertices_node, f"{{{MODEL_NAMESPACE}}}vertex")
-            vertex_node.attrib["x"] = str(vertex[0])
-            vertex_node.attrib["y"] = str(vertex[1])
-            vertex_node.attrib["z"] = str(vertex[2])
+        # Set up the XML data to parse, all in one go.
+        vertex_elements = "".join(f"<vertex x=\"{x}\" y=\"{y}\" z=\"{z}\" />" for x, y, z in vertices)
+        object_node = xml.etree.ElementTree.fromstring(
+            f"""<object xmlns="{MODEL_NAMESPACE}"><mesh><vertices>{vertex_elements}</vertices></mesh></object>""")
 
         self.assertListEqual(
             self.importer.read_vertices(object_node),
@@ -957,14 +970,12 @@ class TestImport3MF(unittest.TestCase):
         """
         Tests reading vertices where some coordinate might be missing.
         """
-        object_node = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}object")
-        mesh_node = xml.etree.ElementTree.SubElement(object_node, f"{{{MODEL_NAMESPACE}}}mesh")
-        vertices_node = xml.etree.ElementTree.SubElement(mesh_node, f"{{{MODEL_NAMESPACE}}}vertices")
-        vertex_node = xml.etree.ElementTree.SubElement(vertices_node, f"{{{MODEL_NAMESPACE}}}vertex")
-
-        vertex_node.attrib["x"] = "13.37"
-        # Don't write a Y value.
-        vertex_node.attrib["z"] = "6.9"
+        object_node, vertices_node, _ = self.new_mesh_document()
+        xml.etree.ElementTree.SubElement(vertices_node, TAG_VERTEX, attrib={
+            "x": "13.37",
+            # Don't write a Y value.
+            "z": "6.9"
+        })
 
         self.assertListEqual(
             self.importer.read_vertices(object_node),
@@ -975,14 +986,12 @@ class TestImport3MF(unittest.TestCase):
         """
         Tests reading vertices where some coordinate is not a floating point value.
         """
-        object_node = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}object")
-        mesh_node = xml.etree.ElementTree.SubElement(object_node, f"{{{MODEL_NAMESPACE}}}mesh")
-        vertices_node = xml.etree.ElementTree.SubElement(mesh_node, f"{{{MODEL_NAMESPACE}}}vertices")
-        vertex_node = xml.etree.ElementTree.SubElement(vertices_node, f"{{{MODEL_NAMESPACE}}}vertex")
-
-        vertex_node.attrib["x"] = "42"
-        vertex_node.attrib["y"] = "23,37"  # Must use period as the decimal separator.
-        vertex_node.attrib["z"] = "over there"  # Doesn't parse to a float either.
+        object_node, vertices_node, _ = self.new_mesh_document()
+        xml.etree.ElementTree.SubElement(vertices_node, TAG_VERTEX, attrib={
+            "x": "42",
+            "y": "23,37",  # Must use period as the decimal separator.
+            "z": "over there"  # Doesn't parse to a float either.
+        })
 
         self.assertListEqual(
             self.importer.read_vertices(object_node),
@@ -994,8 +1003,8 @@ class TestImport3MF(unittest.TestCase):
         """
         Tests reading triangles when the <triangles> element is missing.
         """
-        object_node = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}object")
-        xml.etree.ElementTree.SubElement(object_node, f"{{{MODEL_NAMESPACE}}}mesh")
+        object_node = xml.etree.ElementTree.Element(TAG_OBJECT)
+        xml.etree.ElementTree.SubElement(object_node, TAG_MESH)
 
         triangles, _ = self.importer.read_triangles(object_node, None, "")
         self.assertListEqual(
@@ -1007,9 +1016,9 @@ class TestImport3MF(unittest.TestCase):
         """
         Tests reading triangles when the <triangles> element is empty.
         """
-        object_node = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}object")
-        mesh_node = xml.etree.ElementTree.SubElement(object_node, f"{{{MODEL_NAMESPACE}}}mesh")
-        xml.etree.ElementTree.SubElement(mesh_node, f"{{{MODEL_NAMESPACE}}}triangles")
+        object_node = xml.etree.ElementTree.Element(TAG_OBJECT)
+        mesh_node = xml.etree.ElementTree.SubElement(object_node, TAG_MESH)
+        xml.etree.ElementTree.SubElement(mesh_node, TAG_TRIANGLES)
 
         triangles, _ = self.importer.read_triangles(object_node, None, "")
         self.assertListEqual(
@@ -1025,14 +1034,9 @@ class TestImport3MF(unittest.TestCase):
         """
         triangles = [(1, 2, 3), (4, 5, 6), (7, 8, 9)]  # A few triangles to test with.
 
-        object_node = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}object")
-        mesh_node = xml.etree.ElementTree.SubElement(object_node, f"{{{MODEL_NAMESPACE}}}mesh")
-        triangles_node = xml.etree.ElementTree.SubElement(mesh_node, f"{{{MODEL_NAMESPACE}}}triangles")
-        for triangle in triangles:
-            triangle_node = xml.etree.ElementTree.SubElement(triangles_node, f"{{{MODEL_NAMESPACE}}}triangle")
-            triangle_node.attrib["v1"] = str(triangle[0])
-            triangle_node.attrib["v2"] = str(triangle[1])
-            triangle_node.attrib["v3"] = str(triangle[2])
+        triangle_elements = "".join(f"<triangle v1=\"{v1}\" v2=\"{v2}\" v3=\"{v3}\" />" for v1, v2, v3 in triangles)
+        object_node = xml.etree.ElementTree.fromstring(
+            f"""<object xmlns="{MODEL_NAMESPACE}"><mesh><triangles>{triangle_elements}</triangles></mesh></object>""")
 
         reconstructed_triangles, _ = self.importer.read_triangles(object_node, None, "")
         self.assertListEqual(
@@ -1040,54 +1044,32 @@ class TestImport3MF(unittest.TestCase):
             triangles,
             "The outcome must be the same triangles as what we put in.")
 
-    def test_read_triangles_missing_vertex(self):
-        """
-        Tests reading a triangle where one of the vertices is missing.
-
-        That's a broken triangle then and it shouldn't be returned.
-        """
-        object_node = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}object")
-        mesh_node = xml.etree.ElementTree.SubElement(object_node, f"{{{MODEL_NAMESPACE}}}mesh")
-        triangles_node = xml.etree.ElementTree.SubElement(mesh_node, f"{{{MODEL_NAMESPACE}}}triangles")
-        triangle_node = xml.etree.ElementTree.SubElement(triangles_node, f"{{{MODEL_NAMESPACE}}}triangle")
-        triangle_node.attrib["v1"] = "1"
-        triangle_node.attrib["v2"] = "2"
-        # Leave out v3. It's missing then.
-
-        triangles, _ = self.importer.read_triangles(object_node, None, "")
-        self.assertListEqual(triangles, [], "The only triangle was invalid, so the output should have no triangles.")
-
     def test_read_triangles_broken_vertex(self):
         """
-        Tests reading a triangle where one of the vertices is broken.
+        Tests reading a triangle where one of the vertices is missing or broken.
 
         That's a broken triangle then and it shouldn't be returned.
         """
-        object_node = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}object")
-        mesh_node = xml.etree.ElementTree.SubElement(object_node, f"{{{MODEL_NAMESPACE}}}mesh")
-        triangles_node = xml.etree.ElementTree.SubElement(mesh_node, f"{{{MODEL_NAMESPACE}}}triangles")
-        negative_index_triangle_node = xml.etree.ElementTree.SubElement(
-            triangles_node,
-            f"{{{MODEL_NAMESPACE}}}triangle")
-        negative_index_triangle_node.attrib["v1"] = "1"
-        negative_index_triangle_node.attrib["v2"] = "-1"  # Invalid! Makes the triangle go missing.
-        negative_index_triangle_node.attrib["v3"] = "2"
-        float_index_triangle_node = xml.etree.ElementTree.SubElement(
-            triangles_node,
-            f"{{{MODEL_NAMESPACE}}}triangle")
-        float_index_triangle_node.attrib["v1"] = "2.5"  # Not an integer! Should make the triangle go missing.
-        float_index_triangle_node.attrib["v2"] = "3"
-        float_index_triangle_node.attrib["v3"] = "4"
-        invalid_index_triangle_node = xml.etree.ElementTree.SubElement(
-            triangles_node,
-            f"{{{MODEL_NAMESPACE}}}triangle")
-        invalid_index_triangle_node.attrib["v1"] = "5"
-        invalid_index_triangle_node.attrib["v2"] = "6"
-        # Doesn't parse as integer! Should make the triangle go missing.
-        invalid_index_triangle_node.attrib["v3"] = "doodie"
+        broken_triangles = [
+            {"v1": "1", "v2": "2"},  # Leave out v3. It's missing then.
+            {"v1": "1", "v2": "-1", "v3": "2"},  # Negative index. Invalid! Makes the triangle go missing.
+            {"v1": "2.5", "v2": "3", "v3": "4"},  # Not an integer! Should make the triangle go missing.
+            {"v1": "5", "v2": "6", "v3": "doodie"}  # Doesn't parse as integer! Should make the triangle go missing.
+        ]
 
-        triangles, _ = self.importer.read_triangles(object_node, None, "")
-        self.assertListEqual(triangles, [], "All triangles are invalid, so the output should have no triangles.")
+        # Each broken triangle is tested on its own, in the same document.
+        object_node, _, triangles_node = self.new_mesh_document()
+        triangle_node = xml.etree.ElementTree.SubElement(triangles_node, TAG_TRIANGLE)
+        for attributes in broken_triangles:
+            with self.subTest(triangle=attributes):
+                triangle_node.attrib.clear()
+                triangle_node.attrib.update(attributes)
+
+                triangles, _ = self.importer.read_triangles(object_node, None, "")
+                self.assertListEqual(
+                    triangles,
+                    [],
+                    "The only triangle was invalid, so the output should have no triangles.")
 
     def test_read_triangles_default_material(self):
         """
@@ -1095,10 +1077,8 @@ class TestImport3MF(unittest.TestCase):
 
         The triangle doesn't set a material, but the object does.
         """
-        object_node = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}object")
-        mesh_node = xml.etree.ElementTree.SubElement(object_node, f"{{{MODEL_NAMESPACE}}}mesh")
-        triangles_node = xml.etree.ElementTree.SubElement(mesh_node, f"{{{MODEL_NAMESPACE}}}triangles")
-        xml.etree.ElementTree.SubElement(triangles_node, f"{{{MODEL_NAMESPACE}}}triangle", attrib={
+        object_node, _, triangles_node = self.new_mesh_document()
+        xml.etree.ElementTree.SubElement(triangles_node, TAG_TRIANGLE, attrib={
             "v1": "1",
             "v2": "2",
             "v3": "3"
@@ -1119,10 +1099,8 @@ class TestImport3MF(unittest.TestCase):
 
         It should fall back to the default material of the object then.
         """
-        object_node = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}object")
-        mesh_node = xml.etree.ElementTree.SubElement(object_node, f"{{{MODEL_NAMESPACE}}}mesh")
-        triangles_node = xml.etree.ElementTree.SubElement(mesh_node, f"{{{MODEL_NAMESPACE}}}triangles")
-        xml.etree.ElementTree.SubElement(triangles_node, f"{{{MODEL_NAMESPACE}}}triangle", attrib={
+        object_node, _, triangles_node = self.new_mesh_document()
+        xml.etree.ElementTree.SubElement(triangles_node, TAG_TRIANGLE, attrib={
             "v1": "1",
             "v2": "2",
             "v3": "3",
@@ -1148,10 +1126,8 @@ class TestImport3MF(unittest.TestCase):
 
         It should use the object's default PID then but still use the index.
         """
-        object_node = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}object")
-        mesh_node = xml.etree.ElementTree.SubElement(object_node, f"{{{MODEL_NAMESPACE}}}mesh")
-        triangles_node = xml.etree.ElementTree.SubElement(mesh_node, f"{{{MODEL_NAMESPACE}}}triangles")
-        xml.etree.ElementTree.SubElement(triangles_node, f"{{{MODEL_NAMESPACE}}}triangle", attrib={
+        object_node, _, triangles_node = self.new_mesh_document()
+        xml.etree.ElementTree.SubElement(triangles_node, TAG_TRIANGLE, attrib={
             "v1": "1",
             "v2": "2",
             "v3": "3",
@@ -1176,10 +1152,8 @@ class TestImport3MF(unittest.TestCase):
         """
         Tests reading a triangle that overrides both the PID and the index.
         """
-        object_node = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}object")
-        mesh_node = xml.etree.ElementTree.SubElement(object_node, f"{{{MODEL_NAMESPACE}}}mesh")
-        triangles_node = xml.etree.ElementTree.SubElement(mesh_node, f"{{{MODEL_NAMESPACE}}}triangles")
-        xml.etree.ElementTree.SubElement(triangles_node, f"{{{MODEL_NAMESPACE}}}triangle", attrib={
+        object_node, _, triangles_node = self.new_mesh_document()
+        xml.etree.ElementTree.SubElement(triangles_node, TAG_TRIANGLE, attrib={
             "v1": "1",
             "v2": "2",
             "v3": "3",
@@ -1205,68 +1179,42 @@ class TestImport3MF(unittest.TestCase):
             [correct_material],
             "The material PID is overridden so it should use a different group of materials now.")
 
-    def test_read_material_index_out_of_range(self):
+    def test_read_material_index_invalid(self):
         """
-        Tests reading a triangle where the pindex is out of range for the group.
+        Tests reading a triangle where the pindex is not valid for the group.
 
         It should revert to the default material then.
         """
-        object_node = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}object")
-        mesh_node = xml.etree.ElementTree.SubElement(object_node, f"{{{MODEL_NAMESPACE}}}mesh")
-        triangles_node = xml.etree.ElementTree.SubElement(mesh_node, f"{{{MODEL_NAMESPACE}}}triangles")
-        xml.etree.ElementTree.SubElement(triangles_node, f"{{{MODEL_NAMESPACE}}}triangle", attrib={
-            "v1": "1",
-            "v2": "2",
-            "v3": "3",
-            "p1": "999"  # Way out of range for the material-set material group.
-        })
+        invalid_indices = {
+            "999": "The material index in p1 was way out of range for the 'material-set' group of materials, "
+                   "so it should use the default instead.",
+            "strawberry": "The material index in p1 was not integer, so it should revert to the default."
+        }
         default_material = io_mesh_3mf.import_3mf.ResourceMaterial(name="PLA", color=None)
         self.importer.resource_materials["material-set"] = {
             0: default_material
         }
 
-        # Supply a default PID. It should use the indices from the triangles to reference to this PID.
-        _, materials = self.importer.read_triangles(object_node, default_material, "material-set")
-
-        self.assertListEqual(
-            materials,
-            [default_material],
-            "The material index in p1 was way out of range for the 'material-set' group of materials, "
-            "so it should use the default instead.")
-
-    def test_read_material_index_malformed(self):
-        """
-        Tests reading a triangle where the pindex is not an integer.
-
-        It should revert to the default material then.
-        """
-        object_node = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}object")
-        mesh_node = xml.etree.ElementTree.SubElement(object_node, f"{{{MODEL_NAMESPACE}}}mesh")
-        triangles_node = xml.etree.ElementTree.SubElement(mesh_node, f"{{{MODEL_NAMESPACE}}}triangles")
-        xml.etree.ElementTree.SubElement(triangles_node, f"{{{MODEL_NAMESPACE}}}triangle", attrib={
+        object_node, _, triangles_node = self.new_mesh_document()
+        triangle_node = xml.etree.ElementTree.SubElement(triangles_node, TAG_TRIANGLE, attrib={
             "v1": "1",
             "v2": "2",
-            "v3": "3",
-            "p1": "strawberry"  # Not integer.
+            "v3": "3"
         })
-        default_material = io_mesh_3mf.import_3mf.ResourceMaterial(name="PLA", color=None)
-        self.importer.resource_materials["material-set"] = {
-            0: default_material
-        }
+        for pindex, message in invalid_indices.items():
+            with self.subTest(pindex=pindex):
+                triangle_node.attrib["p1"] = pindex
 
-        # Supply a default PID. It should use the indices from the triangles to reference to this PID.
-        _, materials = self.importer.read_triangles(object_node, default_material, "material-set")
+                # Supply a default PID. It should use the indices from the triangles to reference to this PID.
+                _, materials = self.importer.read_triangles(object_node, default_material, "material-set")
 
-        self.assertListEqual(
-            materials,
-            [default_material],
-            "The material index in p1 was not integer, so it should revert to the default.")
+                self.assertListEqual(materials, [default_material], message)
 
     def test_read_components_missing(self):
         """
         Tests reading components when the <components> element is missing.
         """
-        object_node = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}object")
+        object_node = xml.etree.ElementTree.Element(TAG_OBJECT)
 
         self.assertListEqual(
             self.importer.read_components(object_node),
@@ -1277,8 +1225,8 @@ class TestImport3MF(unittest.TestCase):
         """
         Tests reading components when the <components> element is empty.
         """
-        object_node = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}object")
-        xml.etree.ElementTree.SubElement(object_node, f"{{{MODEL_NAMESPACE}}}components")
+        object_node = xml.etree.ElementTree.Element(TAG_OBJECT)
+        xml.etree.ElementTree.SubElement(object_node, TAG_COMPONENTS)
 
         self.assertListEqual(
             self.importer.read_components(object_node),
@@ -1296,13 +1244,9 @@ class TestImport3MF(unittest.TestCase):
         # A few object IDs that must be present. They don't necessarily need to appear in order though.
         component_objectids = {"3", "4.2", "-5", "llama"}
 
-        object_node = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}object")
-        components_node = xml.etree.ElementTree.SubElement(object_node, f"{{{MODEL_NAMESPACE}}}components")
-        for component_objectid in component_objectids:
-            component_node = xml.etree.ElementTree.SubElement(
-                components_node,
-                f"{{{MODEL_NAMESPACE}}}component")
-            component_node.attrib["objectid"] = component_objectid
+        component_elements = "".join(f"<component objectid=\"{objectid}\" />" for objectid in component_objectids)
+        object_node = xml.etree.ElementTree.fromstring(
+            f"""<object xmlns="{MODEL_NAMESPACE}"><components>{component_elements}</components></object>""")
 
         result = self.importer.read_components(object_node)
         self.assertSetEqual(
@@ -1316,10 +1260,11 @@ class TestImport3MF(unittest.TestCase):
 
         This component must not be in the output then.
         """
-        object_node = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}object")
-        components_node = xml.etree.ElementTree.SubElement(object_node, f"{{{MODEL_NAMESPACE}}}components")
-        xml.etree.ElementTree.SubElement(components_node, f"{{{MODEL_NAMESPACE}}}component")
-        # No objectid attribute!
+        object_node = xml.etree.ElementTree.fromstring(f"""<object xmlns="{MODEL_NAMESPACE}">
+    <components>
+        <component /> <!-- No objectid attribute! -->
+    </components>
+</object>""")
 
         self.assertListEqual(
             self.importer.read_components(object_node),
@@ -1330,23 +1275,18 @@ class TestImport3MF(unittest.TestCase):
         """
         Tests reading the transformation from a component.
         """
-        object_node = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}object")
-        components_node = xml.etree.ElementTree.SubElement(object_node, f"{{{MODEL_NAMESPACE}}}components")
-        component_node_no_transform = xml.etree.ElementTree.SubElement(
-            components_node,
-            f"{{{MODEL_NAMESPACE}}}component")  # One node without transformation.
-        component_node_no_transform.attrib["objectid"] = "1"
-        component_node_scaled = xml.etree.ElementTree.SubElement(
-            components_node,
-            f"{{{MODEL_NAMESPACE}}}component")
-        component_node_scaled.attrib["objectid"] = "1"
-        component_node_scaled.attrib["transform"] = "2 0 0 0 2 0 0 0 2 0 0 0"  # Scaled 200%.
+        object_node = xml.etree.ElementTree.fromstring(f"""<object xmlns="{MODEL_NAMESPACE}">
+    <components>
+        <component objectid="1" /> <!-- One node without transformation. -->
+        <component objectid="1" transform="2 0 0 0 2 0 0 0 2 0 0 0" /> <!-- Scaled 200%. -->
+    </components>
+</object>""")
 
         result = self.importer.read_components(object_node)
         self.assertEqual(len(result), 2, "We put two components in, both valid, so we must get two components out.")
         self.assertEqual(
             result[0].transformation,
-            mathutils.Matrix.Identity(4),
+            IDENTITY_MATRIX,
             "The transformation of the first element is missing, so it must be the identity matrix.")
         self.assertEqual(
             result[1].transformation,
@@ -1359,11 +1299,13 @@ class TestImport3MF(unittest.TestCase):
 
         It should result in the identity matrix then.
         """
+        result = self.importer.parse_transformation("")
         self.assertEqual(
-            self.importer.parse_transformation(""),
-            mathutils.Matrix.Identity(4),
+            result,
+            IDENTITY_MATRIX,
             "Any missing elements are filled from the identity matrix, "
             "so if everything is missing everything is identity.")
+        self.assertTrue(result.is_frozen, "The identity matrix is shared, so it must not be modifiable.")
 
     def test_parse_transformation_partial(self):
         """
@@ -1399,7 +1341,7 @@ class TestImport3MF(unittest.TestCase):
         """
         # Mock out the function that actually creates the object.
         self.importer.build_object = unittest.mock.MagicMock()
-        root = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}model")
+        root = xml.etree.ElementTree.Element(TAG_MODEL)
 
         self.importer.build_items(root, 1.0)
 
@@ -1412,8 +1354,8 @@ class TestImport3MF(unittest.TestCase):
         """
         # Mock out the function that actually creates the object.
         self.importer.build_object = unittest.mock.MagicMock()
-        root = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}model")
-        xml.etree.ElementTree.SubElement(root, f"{{{MODEL_NAMESPACE}}}build")
+        root = xml.etree.ElementTree.Element(TAG_MODEL)
+        xml.etree.ElementTree.SubElement(root, TAG_BUILD)
         # <build> element left empty.
 
         self.importer.build_items(root, 1.0)
@@ -1429,29 +1371,25 @@ class TestImport3MF(unittest.TestCase):
         """
         # Mock out the function that actually creates the object.
         self.importer.build_object = unittest.mock.MagicMock()
-        self.importer.resource_objects["1"] = unittest.mock.MagicMock()  # Add a few "resources".
-        self.importer.resource_objects["2"] = unittest.mock.MagicMock()
-        self.importer.resource_objects["ananas"] = unittest.mock.MagicMock()
+        # Add a few "resources". They are only passed on to build_object, so plain objects suffice as placeholders.
+        self.importer.resource_objects["1"] = object()
+        self.importer.resource_objects["2"] = object()
+        self.importer.resource_objects["ananas"] = object()
         # Build a document with three <item> elements in the <build> element.
-        root = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}model")
-        build_element = xml.etree.ElementTree.SubElement(root, f"{{{MODEL_NAMESPACE}}}build")
-        item1_element = xml.etree.ElementTree.SubElement(build_element, f"{{{MODEL_NAMESPACE}}}item")
-        item1_element.attrib["objectid"] = "1"
-        item2_element = xml.etree.ElementTree.SubElement(build_element, f"{{{MODEL_NAMESPACE}}}item")
-        item2_element.attrib["objectid"] = "2"
-        itemananas_element = xml.etree.ElementTree.SubElement(build_element, f"{{{MODEL_NAMESPACE}}}item")
-        itemananas_element.attrib["objectid"] = "ananas"
+        root = xml.etree.ElementTree.fromstring(f"""<model xmlns="{MODEL_NAMESPACE}">
+    <build>
+        <item objectid="1" />
+        <item objectid="2" />
+        <item objectid="ananas" />
+    </build>
+</model>""")
 
         self.importer.build_items(root, 1.0)
 
+        no_metadata = Metadata()  # None of the items has metadata, so they can all share one empty storage.
         expected_args_list = [
-            unittest.mock.call(self.importer.resource_objects["1"], mathutils.Matrix.Identity(4), Metadata(), ["1"]),
-            unittest.mock.call(self.importer.resource_objects["2"], mathutils.Matrix.Identity(4), Metadata(), ["2"]),
-            unittest.mock.call(
-                self.importer.resource_objects["ananas"],
-                mathutils.Matrix.Identity(4),
-                Metadata(),
-                ["ananas"])
+            unittest.mock.call(self.importer.resource_objects[objectid], IDENTITY_MATRIX, no_metadata, [objectid])
+            for objectid in ["1", "2", "ananas"]
         ]
         self.assertListEqual(
             self.importer.build_object.call_args_list,
@@ -1465,9 +1403,9 @@ class TestImport3MF(unittest.TestCase):
         # Mock out the function that actually creates the object.
         self.importer.build_object = unittest.mock.MagicMock()
         # Build a document with an <item> in it.
-        root = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}model")
-        build_element = xml.etree.ElementTree.SubElement(root, f"{{{MODEL_NAMESPACE}}}build")
-        item_element = xml.etree.ElementTree.SubElement(build_element, f"{{{MODEL_NAMESPACE}}}item")
+        root = xml.etree.ElementTree.Element(TAG_MODEL)
+        build_element = xml.etree.ElementTree.SubElement(root, TAG_BUILD)
+        item_element = xml.etree.ElementTree.SubElement(build_element, TAG_ITEM)
         item_element.attrib["objectid"] = "bombosity"  # Object ID doesn't exist.
 
         self.importer.build_items(root, 1.0)
@@ -1482,9 +1420,9 @@ class TestImport3MF(unittest.TestCase):
         self.importer.build_object = unittest.mock.MagicMock()
         self.importer.resource_objects["1"] = self.single_triangle
         # Build a document with an <item> in it.
-        root = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}model")
-        build_element = xml.etree.ElementTree.SubElement(root, f"{{{MODEL_NAMESPACE}}}build")
-        item_element = xml.etree.ElementTree.SubElement(build_element, f"{{{MODEL_NAMESPACE}}}item")
+        root = xml.etree.ElementTree.Element(TAG_MODEL)
+        build_element = xml.etree.ElementTree.SubElement(root, TAG_BUILD)
+        item_element = xml.etree.ElementTree.SubElement(build_element, TAG_ITEM)
         item_element.attrib["objectid"] = "1"
 
         self.importer.build_items(root, 2.5)  # Build with a unit scale of 250%.
@@ -1495,6 +1433,28 @@ class TestImport3MF(unittest.TestCase):
             Metadata(),
             ["1"])
 
+    def test_build_items_untransformed(self):
+        """
+        Tests building an item without transformation and without unit scale.
+
+        The item then gets the shared identity matrix.
+        """
+        self.importer.build_object = unittest.mock.MagicMock()  # Mock out building the object itself.
+        self.importer.resource_objects["1"] = self.single_triangle
+        root = xml.etree.ElementTree.fromstring(f"""<model xmlns="{MODEL_NAMESPACE}">
+    <build>
+        <item objectid="1" />
+    </build>
+</model>""")
+
+        self.importer.build_items(root, 1.0)
+
+        transformation = self.importer.build_object.call_args[0][1]
+        self.assertIs(
+            transformation,
+            io_mesh_3mf.import_3mf.IDENTITY,
+            "Neither the item nor the unit scale transforms the object, so it must get the shared identity matrix.")
+
     def test_build_items_transformed(self):
         """
         Tests building items that are being transformed.
@@ -1503,9 +1463,9 @@ class TestImport3MF(unittest.TestCase):
         self.importer.build_object = unittest.mock.MagicMock()
         self.importer.resource_objects["1"] = self.single_triangle
         # Build a document with an <item> in it.
-        root = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}model")
-        build_element = xml.etree.ElementTree.SubElement(root, f"{{{MODEL_NAMESPACE}}}build")
-        item_element = xml.etree.ElementTree.SubElement(build_element, f"{{{MODEL_NAMESPACE}}}item")
+        root = xml.etree.ElementTree.Element(TAG_MODEL)
+        build_element = xml.etree.ElementTree.SubElement(root, TAG_BUILD)
+        item_element = xml.etree.ElementTree.SubElement(build_element, TAG_ITEM)
         item_element.attrib["objectid"] = "1"
         item_element.attrib["transform"] = "1 0 0 0 1 0 0 0 1 30 40 0"
 
@@ -1527,22 +1487,16 @@ class TestImport3MF(unittest.TestCase):
         # Mock out the function that actually creates the object.
         self.importer.build_object = unittest.mock.MagicMock()
         self.importer.resource_objects["1"] = self.single_triangle
-        # Build a document with an <item> in it.
-        root = xml.etree.ElementTree.Element(f"{{{MODEL_NAMESPACE}}}model")
-        build_element = xml.etree.ElementTree.SubElement(root, f"{{{MODEL_NAMESPACE}}}build")
-        item_element = xml.etree.ElementTree.SubElement(build_element, f"{{{MODEL_NAMESPACE}}}item")
-        item_element.attrib["objectid"] = "1"
-
-        # Add some metadata.
-        item_element.attrib["partnumber"] = "numero uno"
-        metadata_element = xml.etree.ElementTree.SubElement(
-            item_element,
-            f"{{{MODEL_NAMESPACE}}}metadatagroup")
-        title_element = xml.etree.ElementTree.SubElement(
-            metadata_element,
-            f"{{{MODEL_NAMESPACE}}}metadata")
-        title_element.attrib["name"] = "Title"
-        title_element.text = "Lead Potato Engineer"
+        # Build a document with an <item> in it, with some metadata.
+        root = xml.etree.ElementTree.fromstring(f"""<model xmlns="{MODEL_NAMESPACE}">
+    <build>
+        <item objectid="1" partnumber="numero uno">
+            <metadatagroup>
+                <metadata name="Title">Lead Potato Engineer</metadata>
+            </metadatagroup>
+        </item>
+    </build>
+</model>""")
 
         self.importer.build_items(root, 1.0)  # Build the item, executing the code under test.
 
@@ -1559,14 +1513,14 @@ class TestImport3MF(unittest.TestCase):
             value="Lead Potato Engineer")
         self.importer.build_object.assert_called_once_with(
             self.single_triangle,
-            mathutils.Matrix.Identity(4),
+            IDENTITY_MATRIX,
             expected_metadata, ["1"])
 
     def test_build_object_mesh_data(self):
         """
         Tests whether building a single object results in correct mesh data.
         """
-        transformation = mathutils.Matrix.Identity(4)
+        transformation = IDENTITY_MATRIX
         objectid_stack_trace = ["1"]
         self.importer.build_object(self.single_triangle, transformation, Metadata(), objectid_stack_trace)
 
@@ -1576,11 +1530,34 @@ class TestImport3MF(unittest.TestCase):
         # The mesh must be provided with correct vertex and triangle data.
         mesh_mock.from_pydata.assert_called_once_with(self.single_triangle.vertices, [], self.single_triangle.triangles)
 
+    def test_build_object_materials(self):
+        """
+        Tests whether building an object with materials assigns the correct materials to its triangles.
+        """
+        red = io_mesh_3mf.import_3mf.ResourceMaterial(name="Red", color=(1.0, 0.0, 0.0, 1.0))
+        blue = io_mesh_3mf.import_3mf.ResourceMaterial(name="Blue", color=(0.0, 0.0, 1.0, 1.0))
+        resource_object = io_mesh_3mf.import_3mf.ResourceObject(
+            vertices=[(0.0, 0.0, 0.0), (5.0, 0.0, 1.0), (0.0, 5.0, 1.0), (5.0, 5.0, 0.0)],
+            triangles=[(0, 1, 2), (1, 2, 3), (0, 1, 3), (0, 2, 3)],
+            materials=[red, blue, red, None],
+            components=[],
+            metadata=Metadata()
+        )
+        # Let the mesh report how many materials have been appended to it so far.
+        mesh_mock = bpy.data.meshes.new()
+        mesh_mock.materials.items.side_effect = lambda: [None] * mesh_mock.materials.append.call_count
+
+        self.importer.build_object(resource_object, IDENTITY_MATRIX, Metadata(), ["1"])
+
+        self.assertEqual(mesh_mock.materials.append.call_count, 2, "There are two different materials in this mesh.")
+        # The triangle without material gets the default index 0.
+        mesh_mock.polygons.foreach_set.assert_called_once_with("material_index", [0, 1, 0, 0])
+
     def test_build_object_blender_object(self):
         """
         Tests whether building a single object results in a correct Blender object.
         """
-        transformation = mathutils.Matrix.Identity(4)
+        transformation = IDENTITY_MATRIX
         objectid_stack_trace = ["1"]
         self.importer.build_object(self.single_triangle, transformation, Metadata(), objectid_stack_trace)
 
@@ -1617,7 +1594,7 @@ class TestImport3MF(unittest.TestCase):
         """
         Tests building an object with a parent.
         """
-        transformation = mathutils.Matrix.Identity(4)
+        transformation = IDENTITY_MATRIX
         objectid_stack_trace = ["1", "2"]
         parent = unittest.mock.MagicMock()
         self.importer.build_object(self.single_triangle, transformation, Metadata(), objectid_stack_trace, parent)
@@ -1638,7 +1615,7 @@ class TestImport3MF(unittest.TestCase):
             materials=[None],
             components=[io_mesh_3mf.import_3mf.Component(
                 resource_object="1",
-                transformation=mathutils.Matrix.Identity(4)
+                transformation=IDENTITY_MATRIX
             )],
             metadata=Metadata()
         )
@@ -1652,7 +1629,7 @@ class TestImport3MF(unittest.TestCase):
         bpy.data.objects.new.side_effect = [parent_mock, child_mock]
 
         # Call the function under test.
-        transformation = mathutils.Matrix.Identity(4)
+        transformation = IDENTITY_MATRIX
         objectid_stack_trace = ["2"]
         self.importer.build_object(with_component, transformation, Metadata(), objectid_stack_trace)
 
@@ -1665,6 +1642,78 @@ class TestImport3MF(unittest.TestCase):
             child_mock.parent,
             parent_mock,
             "The component's parent must be set to the parent object.")
+        self.assertEqual(
+            bpy.context.view_layer.objects.active,
+            parent_mock,
+            "The top-level object must be made active, not its component.")
+        bpy.ops.object.add.assert_not_called()  # Objects must be created via the data API, not via operators.
+
+    def test_build_object_repeated_component(self):
+        """
+        Tests building an object that uses the same component multiple times.
+
+        The mesh data of the component must only be created once, and then be shared by all of its instances.
+        """
+        # A model without mesh data of its own, but two instances of the same component.
+        with_components = io_mesh_3mf.import_3mf.ResourceObject(
+            vertices=[],
+            triangles=[],
+            materials=[],
+            components=[
+                io_mesh_3mf.import_3mf.Component(
+                    resource_object="1",
+                    transformation=IDENTITY_MATRIX),
+                io_mesh_3mf.import_3mf.Component(
+                    resource_object="1",
+                    transformation=mathutils.Matrix.Translation(mathutils.Vector([10.0, 0.0, 0.0])))
+            ],
+            metadata=Metadata()
+        )
+        self.importer.resource_objects["1"] = self.single_triangle
+        self.importer.resource_objects["2"] = with_components
+
+        # Call the function under test.
+        transformation = IDENTITY_MATRIX
+        objectid_stack_trace = ["2"]
+        self.importer.build_object(with_components, transformation, Metadata(), objectid_stack_trace)
+
+        self.assertEqual(
+            bpy.data.objects.new.call_count,
+            3,
+            "We must have created 3 objects from this: the parent and two instances of the component.")
+        self.assertEqual(
+            bpy.data.meshes.new.call_count,
+            1,
+            "The mesh of the component must only be created once, and shared by both instances.")
+
+    def test_build_object_identical_meshes(self):
+        """
+        Tests building two different resource objects that contain exactly the same mesh data.
+
+        The mesh data must then be shared between them, even though they are different resources.
+        """
+        copy_of_triangle = io_mesh_3mf.import_3mf.ResourceObject(  # Same data as the single triangle.
+            vertices=[(0.0, 0.0, 0.0), (5.0, 0.0, 1.0), (0.0, 5.0, 1.0)],
+            triangles=[(0, 1, 2)],
+            materials=[None],
+            components=[],
+            metadata=Metadata()
+        )
+        different_triangle = io_mesh_3mf.import_3mf.ResourceObject(  # Different coordinates.
+            vertices=[(0.0, 0.0, 0.0), (10.0, 0.0, 2.0), (0.0, 10.0, 2.0)],
+            triangles=[(0, 1, 2)],
+            materials=[None],
+            components=[],
+            metadata=Metadata()
+        )
+
+        transformation = IDENTITY_MATRIX
+        self.importer.build_object(self.single_triangle, transformation, Metadata(), ["1"])
+        self.importer.build_object(copy_of_triangle, transformation, Metadata(), ["2"])
+        self.assertEqual(bpy.data.meshes.new.call_count, 1, "The second resource has the same mesh, so re-use it.")
+
+        self.importer.build_object(different_triangle, transformation, Metadata(), ["3"])
+        self.assertEqual(bpy.data.meshes.new.call_count, 2, "The third resource is different, so needs a new mesh.")
 
     def test_build_object_recursive(self):
         """
@@ -1678,20 +1727,58 @@ class TestImport3MF(unittest.TestCase):
             materials=[None],
             components=[io_mesh_3mf.import_3mf.Component(
                 resource_object="1",
-                transformation=mathutils.Matrix.Identity(4)
+                transformation=IDENTITY_MATRIX
             )],
             metadata=Metadata()
         )
         self.importer.resource_objects["1"] = resource_object
 
         # Call the function under test.
-        transformation = mathutils.Matrix.Identity(4)
+        transformation = IDENTITY_MATRIX
         objectid_stack_trace = ["1"]
         self.importer.build_object(resource_object, transformation, Metadata(), objectid_stack_trace)
 
         # Test whether the component got created.
         bpy.data.objects.new.assert_called_once()  # May be called only once. Don't call for the recursive component!
 
+    def test_build_object_recursive_indirect(self):
+        """
+        Tests building an object with a component two levels down that refers back to one of its ancestors.
+
+        Object 1 contains 2, which contains 3, which contains 2 again. The last component would loop infinitely, so it
+        should be ignored, while the rest of the hierarchy gets built.
+        """
+        def with_component(objectid):
+            return io_mesh_3mf.import_3mf.ResourceObject(
+                vertices=[],
+                triangles=[],
+                materials=[],
+                components=[io_mesh_3mf.import_3mf.Component(resource_object=objectid, transformation=IDENTITY_MATRIX)],
+                metadata=Metadata()
+            )
+        self.importer.resource_objects["1"] = with_component("2")
+        self.importer.resource_objects["2"] = with_component("3")
+        self.importer.resource_objects["3"] = with_component("2")  # Refers back to its parent.
+
+        # Call the function under test, tracking the stack trace in both forms.
+        objectid_stack_trace = ["1"]
+        objectids_in_stack = {"1"}
+        with self.assertLogs("io_mesh_3mf.import_3mf", level="WARNING") as logs:
+            self.importer.build_object(
+                self.importer.resource_objects["1"],
+                IDENTITY_MATRIX,
+                Metadata(),
+                objectid_stack_trace,
+                objectids_in_stack=objectids_in_stack)
+
+        self.assertEqual(bpy.data.objects.new.call_count, 3, "Objects 1, 2 and 3 get built, but not 2 a second time.")
+        self.assertEqual(
+            logs.output,
+            ["WARNING:io_mesh_3mf.import_3mf:Recursive components in object ID: 2"],
+            "The component of object 3 refers back to object 2, so it must be refused.")
+        self.assertListEqual(objectid_stack_trace, ["1"], "After building, only the original object is in the trace.")
+        self.assertSetEqual(objectids_in_stack, {"1"}, "The set of object IDs must be restored along with the trace.")
+
     def test_build_object_component_unknown(self):
         """
         Tests building an object with a component referring to a non-existing ID.
@@ -1702,14 +1789,14 @@ class TestImport3MF(unittest.TestCase):
             materials=[None],
             components=[io_mesh_3mf.import_3mf.Component(
                 resource_object="2",  # This object ID doesn't exist!
-                transformation=mathutils.Matrix.Identity(4)
+                transformation=IDENTITY_MATRIX
             )],
             metadata=Metadata()
         )
         self.importer.resource_objects["1"] = resource_object
 
         # Call the function under test.
-        transformation = mathutils.Matrix.Identity(4)
+        transformation = IDENTITY_MATRIX
         objectid_stack_trace = ["1"]
         self.importer.build_object(resource_object, transformation, Metadata(), objectid_stack_trace)
 
@@ -1753,3 +1840,67 @@ class TestImport3MF(unittest.TestCase):
             child_mock.matrix_world,
             transformation @ mathutils.Matrix.Scale(2.0, 4),
             "The child must be transformed with both the parent transform and the component's transformation.")
+
+    def test_build_object_component_identity(self):
+        """
+        Tests building an object with a component that is not transformed.
+
+        The component must then get the same transformation as its parent.
+        """
+        with_component = io_mesh_3mf.import_3mf.ResourceObject(  # A model with an untransformed component.
+            vertices=[],
+            triangles=[],
+            materials=[],
+            components=[io_mesh_3mf.import_3mf.Component(
+                resource_object="1",
+                transformation=io_mesh_3mf.import_3mf.IDENTITY
+            )],
+            metadata=Metadata()
+        )
+        self.importer.resource_objects["1"] = self.single_triangle
+        self.importer.resource_objects["2"] = with_component
+        parent_mock = unittest.mock.MagicMock()
+        child_mock = unittest.mock.MagicMock()
+        bpy.data.objects.new.side_effect = [parent_mock, child_mock]
+
+        # Call the function under test.
+        transformation = mathutils.Matrix.Translation(mathutils.Vector([100.0, 0.0, 0.0]))
+        objectid_stack_trace = ["2"]
+        self.importer.build_object(with_component, transformation, Metadata(), objectid_stack_trace)
+
+        self.assertIs(
+            child_mock.matrix_world,
+            transformation,
+            "The component is not transformed, so it gets the same transformation as its parent, without multiplying.")
+
+    def test_build_object_parent_identity(self):
+        """
+        Tests building an object that is not transformed, with a component that is.
+
+        The component must then get its own transformation.
+        """
+        component_transformation = mathutils.Matrix.Translation(mathutils.Vector([100.0, 0.0, 0.0]))
+        with_component = io_mesh_3mf.import_3mf.ResourceObject(  # A model with a transformed component.
+            vertices=[],
+            triangles=[],
+            materials=[],
+            components=[io_mesh_3mf.import_3mf.Component(
+                resource_object="1",
+                transformation=component_transformation
+            )],
+            metadata=Metadata()
+        )
+        self.importer.resource_objects["1"] = self.single_triangle
+        self.importer.resource_objects["2"] = with_component
+        parent_mock = unittest.mock.MagicMock()
+        child_mock = unittest.mock.MagicMock()
+        bpy.data.objects.new.side_effect = [parent_mock, child_mock]
+
+        # Call the function under test.
+        objectid_stack_trace = ["2"]
+        self.importer.build_object(with_component, io_mesh_3mf.import_3mf.IDENTITY, Metadata(), objectid_stack_trace)
+
+        self.assertIs(
+            child_mock.matrix_world,
+            component_transformation,
+            "The parent is not transformed, so the component gets its own transformation, without multiplying.")
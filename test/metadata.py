@@ -10,21 +10,10 @@
 
 # <pep8 compliant>
 
-import unittest.mock  # To mock away the Blender API.
+import unittest  # To run the tests.
 
-from .mock.bpy import MockOperator, MockExportHelper, MockImportHelper
-
-# The import and export classes inherit from classes from the Blender API. These classes would be MagicMocks as well.
-# However their metaclasses are then also MagicMocks, but different instances of MagicMock.
-# Python sees this as that the metaclasses that ImportHelper/ExportHelper inherits from are not the same and raises an
-# error. So here we need to specify that the classes that they inherit from are NOT MagicMock but just an ordinary mock
-# object.
-import bpy.types
-import bpy_extras.io_utils
-bpy.types.Operator = MockOperator
-bpy_extras.io_utils.ImportHelper = MockImportHelper
-bpy_extras.io_utils.ExportHelper = MockExportHelper
-import io_mesh_3mf.metadata  # Now finally we can import the unit under test.
+# The unit under test. The test package has mocked the Blender API before this.
+from io_mesh_3mf.metadata import Metadata, MetadataEntry
 
 
 class TestMetadata(unittest.TestCase):
@@ -36,7 +25,17 @@ class TestMetadata(unittest.TestCase):
         """
         Creates some fixtures to test with.
         """
-        self.metadata = io_mesh_3mf.metadata.Metadata()
+        self.metadata = Metadata()
+
+    def new_duplicate(self, preserve=False, datatype="int", value="5"):
+        """
+        Creates a metadata entry named "duplicate", for the tests that store multiple entries under the same name.
+        :param preserve: Whether the entry needs to be preserved.
+        :param datatype: The data type of the entry.
+        :param value: The value of the entry.
+        :return: A `MetadataEntry` with those properties.
+        """
+        return MetadataEntry(name="duplicate", preserve=preserve, datatype=datatype, value=value)
 
     def test_store_retrieve(self):
         """
@@ -49,48 +48,32 @@ class TestMetadata(unittest.TestCase):
         """
         Test storing an entry multiple times with compatible values.
         """
-        self.metadata["duplicate"] = io_mesh_3mf.metadata.MetadataEntry(
-            name="duplicate",
-            preserve=False,
-            datatype="int",
-            value="5")
-        self.metadata["duplicate"] = io_mesh_3mf.metadata.MetadataEntry(
-            name="duplicate",
-            preserve=False,
-            datatype="int",
-            value="5")  # Store twice!
-
-        self.assertEqual(self.metadata["duplicate"].name, "duplicate", "The name was the same, still \"duplicate\".")
-        self.assertFalse(
-            self.metadata["duplicate"].preserve,
-            "Neither of the entries needed to be preserved, so it still doesn't need to be preserved.")
-        self.assertEqual(self.metadata["duplicate"].datatype, "int", "The data type was the same, still \"int\".")
-        self.assertEqual(self.metadata["duplicate"].value, "5", "The value was the same, still \"5\".")
+        self.metadata["duplicate"] = self.new_duplicate()
+        self.metadata["duplicate"] = self.new_duplicate()  # Store twice!
+
+        entry = self.metadata["duplicate"]
+        expected_fields = {
+            "name": ("duplicate", "The name was the same, still \"duplicate\"."),
+            "preserve": (False, "Neither of the entries needed to be preserved, so it still doesn't."),
+            "datatype": ("int", "The data type was the same, still \"int\"."),
+            "value": ("5", "The value was the same, still \"5\".")
+        }
+        for field, (expected, message) in expected_fields.items():
+            with self.subTest(field=field):
+                self.assertEqual(getattr(entry, field), expected, message)
 
     def test_override_preserve(self):
         """
         Tests the overriding of the preserve attribute if metadata entries are compatible.
         """
-        self.metadata["duplicate"] = io_mesh_3mf.metadata.MetadataEntry(
-            name="duplicate",
-            preserve=False,
-            datatype="int",
-            value="5")
-        self.metadata["duplicate"] = io_mesh_3mf.metadata.MetadataEntry(
-            name="duplicate",
-            preserve=True,
-            datatype="int",
-            value="5")  # Preserve the duplicate!
+        self.metadata["duplicate"] = self.new_duplicate()
+        self.metadata["duplicate"] = self.new_duplicate(preserve=True)  # Preserve the duplicate!
 
         self.assertTrue(
             self.metadata["duplicate"].preserve,
             "If any of the duplicates needs to be preserved, the entry indicates that it needs to be preserved.")
 
-        self.metadata["duplicate"] = io_mesh_3mf.metadata.MetadataEntry(
-            name="duplicate",
-            preserve=False,
-            datatype="int",
-            value="5")
+        self.metadata["duplicate"] = self.new_duplicate()
         self.assertTrue(
             self.metadata["duplicate"].preserve,
             "An older entry needed to be preserved, so even if the later entry didn't, it still needs to be preserved.")
@@ -99,26 +82,14 @@ class TestMetadata(unittest.TestCase):
         """
         Tests storing metadata entries that are incompatible with each other because they have different values.
         """
-        self.metadata["duplicate"] = io_mesh_3mf.metadata.MetadataEntry(
-            name="duplicate",
-            preserve=False,
-            datatype="int",
-            value="5")
-        self.metadata["duplicate"] = io_mesh_3mf.metadata.MetadataEntry(
-            name="duplicate",
-            preserve=False,
-            datatype="int",
-            value="6")  # Different value!
+        self.metadata["duplicate"] = self.new_duplicate()
+        self.metadata["duplicate"] = self.new_duplicate(value="6")  # Different value!
 
         self.assertNotIn("duplicate", self.metadata, "It should appear to be removed from the storage.")
         with self.assertRaises(KeyError):
             print("Getting this value should be impossible:", self.metadata["duplicate"])
 
-        self.metadata["duplicate"] = io_mesh_3mf.metadata.MetadataEntry(
-            name="duplicate",
-            preserve=False,
-            datatype="int",
-            value="5")  # Add it again.
+        self.metadata["duplicate"] = self.new_duplicate()  # Add it again.
 
         self.assertNotIn("duplicate", self.metadata, "Since there's conflicts, it should not add it to the storage.")
         with self.assertRaises(KeyError):
@@ -128,26 +99,14 @@ class TestMetadata(unittest.TestCase):
         """
         Tests storing metadata entries that are incompatible with each other because they have different types.
         """
-        self.metadata["duplicate"] = io_mesh_3mf.metadata.MetadataEntry(
-            name="duplicate",
-            preserve=False,
-            datatype="int",
-            value="5")
-        self.metadata["duplicate"] = io_mesh_3mf.metadata.MetadataEntry(
-            name="duplicate",
-            preserve=False,
-            datatype="float",
-            value="5")  # Different data type!
+        self.metadata["duplicate"] = self.new_duplicate()
+        self.metadata["duplicate"] = self.new_duplicate(datatype="float")  # Different data type!
 
         self.assertNotIn("duplicate", self.metadata, "It should appear to be removed from the storage.")
         with self.assertRaises(KeyError):
             print("Getting this value should be impossible:", self.metadata["duplicate"])
 
-        self.metadata["duplicate"] = io_mesh_3mf.metadata.MetadataEntry(
-            name="duplicate",
-            preserve=False,
-            datatype="float",
-            value="5")  # Add it again.
+        self.metadata["duplicate"] = self.new_duplicate(datatype="float")  # Add it again.
 
         self.assertNotIn("duplicate", self.metadata, "Since there's conflicts, it should not add it to the storage.")
         with self.assertRaises(KeyError):
@@ -157,27 +116,27 @@ class TestMetadata(unittest.TestCase):
         """
         Test getting the metadata values.
         """
-        self.metadata["hollow"] = io_mesh_3mf.metadata.MetadataEntry(
+        self.metadata["hollow"] = MetadataEntry(
             name="hollow",
             preserve=True,
             datatype="bool",
             value="True")
-        self.metadata["conflicting"] = io_mesh_3mf.metadata.MetadataEntry(
+        self.metadata["conflicting"] = MetadataEntry(
             name="conflicting",
             preserve=False,
             datatype="int",
             value="5")
-        self.metadata["conflicting"] = io_mesh_3mf.metadata.MetadataEntry(
+        self.metadata["conflicting"] = MetadataEntry(
             name="conflicting",
             preserve=False,
             datatype="float",
             value="5.0")  # Should not show up in the values.
-        self.metadata["author"] = io_mesh_3mf.metadata.MetadataEntry(
+        self.metadata["author"] = MetadataEntry(
             name="author",
             preserve=False,
             datatype="string",
             value="Ghostkeeper")
-        self.metadata["author"] = io_mesh_3mf.metadata.MetadataEntry(
+        self.metadata["author"] = MetadataEntry(
             name="author",
             preserve=False,
             datatype="string",
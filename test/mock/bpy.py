@@ -19,15 +19,43 @@ are just meant to remove the basic import errors and add the missing names.
 
 
 class MockOperator:
-    pass
+    __slots__ = ()
 
 
 class MockImportHelper:
-    pass
+    __slots__ = ()
 
 
 class MockExportHelper:
-    pass
+    __slots__ = ()
+
+
+class MockUnitSettings:
+    """
+    Plain replacement for the unit settings of a Blender scene.
+
+    Tests that only read the unit settings don't need the call recording of a `MagicMock`, which is much slower to
+    construct and to access.
+    """
+    def __init__(self, scale_length=0, length_unit='METERS'):
+        self.scale_length = scale_length
+        self.length_unit = length_unit
+
+
+class MockScene:
+    """
+    Plain replacement for a Blender scene, only containing the unit settings.
+    """
+    def __init__(self):
+        self.unit_settings = MockUnitSettings()
+
+
+class MockContext:
+    """
+    Plain replacement for the Blender context, only containing a scene.
+    """
+    def __init__(self):
+        self.scene = MockScene()
 
 
 class MockPrincipledBSDFWrapper:
@@ -35,6 +63,8 @@ class MockPrincipledBSDFWrapper:
     Transparent wrapper for materials, replacing Blender's PrincipledBSDFWrapper but then doesn't alter the color space
     at all.
     """
+    __slots__ = ("material",)
+
     def __init__(self, material, is_readonly=False):
         self.material = material
 
@@ -43,11 +73,13 @@ class MockPrincipledBSDFWrapper:
             return self.material.diffuse_color[:3]
         if item == "alpha":
             return self.material.diffuse_color[3]
-        return super().__getattribute__(item)
+        raise AttributeError(item)  # Normal lookup already failed before this method got called.
 
     def __setattr__(self, item, value):
         if item == "base_color":
             self.material.diffuse_color[:3] = value
+            return  # Only stored in the material. A copy on the wrapper would hide later changes to the material.
         if item == "alpha":
             self.material.diffuse_color[3] = value
+            return
         super().__setattr__(item, value)